@@ -7,11 +7,106 @@ maneuvers and scenarios at configurable intervals.
 """
 
 import json
+import math
+import os
 import random
+import sys
 import time
-from datetime import datetime
+from collections import Counter
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional accelerator; the standard library is used otherwise
+    orjson = None
+
+# Separator lines for banners and summaries
+_RULE = "=" * 60
+_THIN_RULE = "-" * 60
+
+
+def _loads(data):
+    """Parse a JSON document, using orjson when it is installed.
+    
+    Both parsers raise json.JSONDecodeError (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _format_timestamp(ns: int) -> str:
+    """Format epoch nanoseconds as local time, like datetime.now().isoformat().
+    
+    Formats straight from time.localtime() without building a datetime.
+    """
+    sec, ns = divmod(ns, 1_000_000_000)
+    tm = time.localtime(sec)
+    stamp = (f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+             f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}")
+    micros = ns // 1000
+    # isoformat() leaves out the fraction when it is zero
+    return f"{stamp}.{micros:06d}" if micros else stamp
+
+
+# Parsed JSON documents keyed by (path, mtime, size), see _load_json_file
+_json_cache: Dict[Tuple[str, int, int], Any] = {}
+_JSON_CACHE_MAX_ENTRIES = 8
+
+
+def _load_json_file(path: Path) -> Any:
+    """Read and parse a JSON file, reusing the result while the file is unchanged.
+    
+    Creating several ChairFlying instances in one process (tests, REPL use)
+    otherwise parses the same config and maneuvers files every time. The
+    returned object is shared between callers, so it must be copied before
+    being modified.
+    
+    A file is considered unchanged while its modification time and size are
+    the same, so an edit that keeps the size within the filesystem's timestamp
+    resolution (e.g. 2 seconds on FAT) may return the old contents.
+    
+    Raises:
+        IOError: If the file cannot be opened or read
+        json.JSONDecodeError: If the file does not contain valid JSON
+    """
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        if key in _json_cache:
+            return _json_cache[key]
+        data = _loads(f.read())
+    if len(_json_cache) >= _JSON_CACHE_MAX_ENTRIES:
+        _json_cache.clear()
+    _json_cache[key] = data
+    return data
+
+
+def _validate_probability(value):
+    """Raise ValueError unless value is a number between 0 and 1."""
+    if not isinstance(value, (int, float)):
+        raise ValueError("emergency_probability must be a number")
+    if value < 0 or value > 1:
+        raise ValueError("emergency_probability must be between 0 and 1")
+
+
+def _whole_seconds(key: str, value) -> int:
+    """Return value as an int, raising ValueError unless it is a whole number."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if not isinstance(value, int):
+        raise ValueError(f"{key} must be a whole number of seconds")
+    return value
 
 
 class Configuration:
@@ -20,6 +115,20 @@ class Configuration:
     Encapsulates all configuration parameters with validation and type safety.
     """
     
+    __slots__ = (
+        '_maneuvers_file', '_interval_min_sec', '_interval_max_sec',
+        '_show_next_maneuver_time', '_show_maneuver_type', '_show_maneuver_description',
+        '_emergency_probability',
+    )
+    
+    # Optional settings as (key, default, validator); each is stored as '_' + key
+    _OPTIONAL_FIELDS = (
+        ("show_next_maneuver_time", True, None),
+        ("show_maneuver_type", True, None),
+        ("show_maneuver_description", True, None),
+        ("emergency_probability", None, _validate_probability),
+    )
+    
     def __init__(self, config_dict: Dict):
         """Initialize configuration from a dictionary.
         
@@ -57,28 +166,26 @@ class Configuration:
             )
         
         if has_min and has_max:
-            if config["interval_min_sec"] > config["interval_max_sec"]:
+            # Intervals are drawn from a range of whole seconds, see ChairFlying.get_random_interval
+            interval_min = _whole_seconds("interval_min_sec", config["interval_min_sec"])
+            interval_max = _whole_seconds("interval_max_sec", config["interval_max_sec"])
+            if interval_min > interval_max:
                 raise ValueError("interval_min_sec must be less than or equal to interval_max_sec")
-            self._interval_min_sec = config["interval_min_sec"]
-            self._interval_max_sec = config["interval_max_sec"]
+            self._interval_min_sec = interval_min
+            self._interval_max_sec = interval_max
         else:
             self._interval_min_sec = None
             self._interval_max_sec = None
         
-        # Set default values for display options
-        self._show_next_maneuver_time = config.get("show_next_maneuver_time", True)
-        self._show_maneuver_type = config.get("show_maneuver_type", True)
-        self._show_maneuver_description = config.get("show_maneuver_description", True)
-        
-        # Validate and set emergency_probability if provided
-        self._emergency_probability = None
-        if "emergency_probability" in config:
-            prob = config["emergency_probability"]
-            if not isinstance(prob, (int, float)):
-                raise ValueError("emergency_probability must be a number")
-            if prob < 0 or prob > 1:
-                raise ValueError("emergency_probability must be between 0 and 1")
-            self._emergency_probability = prob
+        # Set optional settings, validating any that were provided
+        for key, default, validator in self._OPTIONAL_FIELDS:
+            if key in config:
+                value = config[key]
+                if validator is not None:
+                    validator(value)
+            else:
+                value = default
+            setattr(self, "_" + key, value)
     
     @property
     def maneuvers_file(self) -> str:
@@ -121,62 +228,393 @@ class Configuration:
 
 
 class ManeuverTracker:
-    """Tracks maneuver completion status and follow-ups."""
+    """Tracks maneuver completion status and follow-ups.
+    
+    History is stored as JSON Lines (one entry per line) so recording a
+    maneuver only appends to the file instead of rewriting it. Appended
+    entries are buffered and flushed in batches.
+    """
     
-    def __init__(self, history_file: str = "maneuver_history.json"):
+    __slots__ = (
+        'history_file', '_history', '_history_size', '_unparsed_entries',
+        '_fh', '_pending', '_last_flush', '_follow_ups', '_file_entry_count',
+    )
+    
+    # Flush buffered entries once this many are pending...
+    FLUSH_MAX_ENTRIES = 8
+    # ...or once this many seconds have passed since the last flush
+    FLUSH_MAX_DELAY_SEC = 1.0
+    
+    def __init__(self, history_file: str = "maneuver_history.jsonl"):
         self.history_file = Path(history_file)
-        self.history: List[Dict] = []
+        self._history: Optional[List[Dict]] = None  # Parsed on first access, see `history`
+        self._history_size = 0  # Bytes of history that existed before this session
+        self._unparsed_entries: List[Dict] = []  # Recorded before history was parsed
+        self._follow_ups: Optional[List[Dict]] = None  # Built on first get_follow_ups
+        self._file_entry_count: Optional[int] = None  # Counted along with the follow-ups
+        self._fh = None  # Append handle, opened on first record
+        self._pending = 0
+        self._last_flush = time.monotonic()
         self.load_history()
     
+    @property
+    def history(self) -> List[Dict]:
+        """All history entries, parsed from the history file on first access.
+        
+        Most sessions only append to the history, so the existing file is not
+        parsed until something actually needs to read it.
+        """
+        if self._history is None:
+            self._history = self._parse_history_file() + self._unparsed_entries
+            self._unparsed_entries = []
+        return self._history
+    
     def load_history(self):
-        """Load history from file if it exists."""
-        if self.history_file.exists():
+        """Prepare history from file if it exists.
+        
+        Existing entries are parsed lazily (see `history`). Files written by
+        older versions contain a single JSON array, either in the history file
+        itself or in a `.json` file of the same name; these are loaded now and
+        rewritten as JSON Lines so new entries can be appended.
+        """
+        self._history = None
+        self._unparsed_entries = []
+        self._follow_ups = None
+        self._file_entry_count = None
+        self._history_size = 0
+        if not self.history_file.exists():
+            # Older versions saved history to e.g. maneuver_history.json
+            legacy_file = self.history_file.with_suffix(".json")
+            if legacy_file != self.history_file and legacy_file.exists():
+                self._convert_legacy_file(legacy_file)
+            return
+        
+        try:
+            if not self._is_legacy_format():
+                self._history_size = self.history_file.stat().st_size
+                return
+        except IOError as e:
+            # Log warning but don't fail - start with empty history
+            print(f"Warning: Could not load history file: {e}")
+            self._history = []
+            return
+        self._convert_legacy_file(self.history_file)
+    
+    def _convert_legacy_file(self, legacy_file: Path):
+        """Load a JSON array history file and rewrite it as the JSON Lines history file.
+        
+        If legacy_file is a separate file, it is renamed with a `.bak` suffix
+        once converted so it isn't converted again. A file that can't be parsed
+        (e.g. truncated by an older version's full rewrite) is renamed the same
+        way, and history starts over in a fresh file.
+        """
+        try:
+            with open(legacy_file, 'rb') as f:
+                content = f.read()
+        except IOError as e:
+            # Log warning but don't fail - start with empty history
+            print(f"Warning: Could not load history file: {e}")
+            self._history = []
+            return
+        
+        try:
+            self._history = _loads(content)
+        except json.JSONDecodeError as e:
+            print(f"Warning: Could not load history file: {e}")
+            self._history = []
+            # Otherwise new entries would be appended to a file that is
+            # detected as legacy, and fails to parse, on every load
+            self._move_aside(legacy_file)
+            return
+        # Keep a separate legacy file in place if its entries couldn't be saved
+        if self.save_history() and legacy_file != self.history_file:
+            self._move_aside(legacy_file)
+    
+    def _move_aside(self, old_file: Path):
+        """Rename a history file that is no longer used by adding a `.bak` suffix."""
+        try:
+            old_file.replace(old_file.with_name(old_file.name + ".bak"))
+        except OSError as e:
+            print(f"Warning: Could not rename old history file: {e}")
+    
+    def _is_legacy_format(self) -> bool:
+        """Check whether the history file holds a single JSON array."""
+        with open(self.history_file, 'rb') as f:
+            for byte in iter(lambda: f.read(1), b""):
+                if not byte.isspace():
+                    return byte == b"["
+        return False
+    
+    def _parse_history_file(self) -> List[Dict]:
+        """Parse the entries that were in the history file when it was loaded."""
+        return list(self._iter_history_file())
+    
+    def _iter_history_lines(self) -> Iterator[bytes]:
+        """Yield the non-blank lines that were in the history file when it was loaded.
+        
+        The file is read line by line, so the whole file is never held in
+        memory at once. Entries appended during this session are not included.
+        """
+        remaining = self._history_size
+        if not remaining:
+            return
+        
+        try:
+            with open(self.history_file, 'rb') as f:
+                for line in f:
+                    if remaining <= 0:
+                        break
+                    line = line[:remaining]
+                    remaining -= len(line)
+                    if line.strip():
+                        yield line
+        except IOError as e:
+            # Log warning but don't fail - treat history as empty
+            print(f"Warning: Could not load history file: {e}")
+    
+    def _iter_history_file(self) -> Iterator[Dict]:
+        """Yield the entries that were in the history file when it was loaded."""
+        for line in self._iter_history_lines():
             try:
-                with open(self.history_file, 'r') as f:
-                    self.history = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                # Log warning but don't fail - start with empty history
-                print(f"Warning: Could not load history file: {e}")
-                self.history = []
-    
-    def save_history(self):
-        """Save history to file."""
+                yield _loads(line)
+            except json.JSONDecodeError:
+                # Skip unreadable lines (e.g. a partial write) but keep the rest
+                print("Warning: Skipping unreadable line in history file")
+    
+    def _scan_history_file(self):
+        """Count the history file's entries and collect its follow-ups in one pass.
+        
+        Only lines that could be reviews are parsed. Other lines are counted if
+        they end like a complete entry, so a partially written line isn't
+        counted.
+        """
+        count = 0
+        follow_ups = []
+        for line in self._iter_history_lines():
+            if b'"review"' in line:
+                try:
+                    entry = _loads(line)
+                except json.JSONDecodeError:
+                    print("Warning: Skipping unreadable line in history file")
+                    continue
+                # "review" may also occur in other fields
+                if entry["status"] == "review":
+                    follow_ups.append(entry)
+            elif not line.rstrip().endswith(b"}"):
+                print("Warning: Skipping unreadable line in history file")
+                continue
+            count += 1
+        self._file_entry_count = count
+        self._follow_ups = follow_ups + [
+            entry for entry in self._unparsed_entries if entry["status"] == "review"
+        ]
+    
+    def save_history(self) -> bool:
+        """Rewrite the history file with every entry currently in memory.
+        
+        Returns:
+            True if the file was written
+        """
+        self.close()
+        # Serialize up front so the file is written with a single call
+        data = b"".join(_dumps(entry) + b"\n" for entry in self.history)
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history, f, indent=2)
+            with open(self.history_file, 'wb') as f:
+                f.write(data)
         except IOError as e:
             print(f"Warning: Could not save history file: {e}")
+            return False
+        return True
     
     def record_maneuver(self, maneuver: Dict, status: str, phase: Optional[Dict] = None):
         """Record a maneuver attempt with timestamp and status."""
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _format_timestamp(time.time_ns()),
             "maneuver": maneuver["name"],
             "type": maneuver.get("type", "normal"),
             "status": status
         }
         if phase:
             entry["phase"] = phase["name"]
-        self.history.append(entry)
-        self.save_history()
+        if self._history is None:
+            self._unparsed_entries.append(entry)
+        else:
+            self._history.append(entry)
+        if self._follow_ups is not None and status == "review":
+            self._follow_ups.append(entry)
+        
+        try:
+            if self._fh is None:
+                self._fh = self._open_for_append()
+            self._fh.write(_dumps(entry) + b"\n")
+        except IOError as e:
+            print(f"Warning: Could not save history file: {e}")
+            return
+        
+        self._pending += 1
+        if (self._pending >= self.FLUSH_MAX_ENTRIES or
+                time.monotonic() - self._last_flush >= self.FLUSH_MAX_DELAY_SEC):
+            self.flush()
+    
+    def _open_for_append(self):
+        """Open the history file for appending, starting on a new line.
+        
+        If the file's last line isn't terminated (a partial write or a hand
+        edit), a newline is written first so the next entry isn't joined to it.
+        """
+        fh = open(self.history_file, 'a+b', buffering=8192)
+        try:
+            if fh.seek(0, os.SEEK_END):
+                fh.seek(-1, os.SEEK_END)
+                if fh.read(1) != b"\n":
+                    fh.write(b"\n")
+        except IOError:
+            fh.close()
+            raise
+        return fh
+    
+    def flush(self):
+        """Write any buffered history entries through to disk.
+        
+        Does nothing if no entries were recorded since the last flush, so
+        closing an idle tracker doesn't cost an fsync.
+        """
+        if self._fh is None or not self._pending:
+            return
+        try:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+        except IOError as e:
+            print(f"Warning: Could not save history file: {e}")
+        self._pending = 0
+        self._last_flush = time.monotonic()
+    
+    def close(self):
+        """Flush buffered history entries and release the history file."""
+        if self._fh is None:
+            return
+        self.flush()
+        self._fh.close()
+        self._fh = None
+    
+    def count_entries(self) -> int:
+        """Count history entries without keeping the parsed history file in memory.
+        
+        The file is counted in the same pass that collects follow-ups, see
+        _scan_history_file.
+        """
+        if self._history is not None:
+            return len(self._history)
+        if self._file_entry_count is None:
+            self._scan_history_file()
+        return self._file_entry_count + len(self._unparsed_entries)
     
     def get_follow_ups(self) -> List[Dict]:
-        """Get list of maneuvers marked for review."""
-        return [entry for entry in self.history if entry["status"] == "review"]
+        """Get list of maneuvers marked for review.
+        
+        History is scanned once; entries recorded afterwards are added to the
+        list as they are recorded.
+        """
+        if self._follow_ups is None:
+            if self._history is None:
+                self._scan_history_file()
+            else:
+                self._follow_ups = [entry for entry in self._history if entry["status"] == "review"]
+        return list(self._follow_ups)
 
 
 class ChairFlying:
     """Main application for chair flying practice."""
     
+    __slots__ = (
+        'config_file', 'config', '_interval_min', '_interval_max', '_emergency_probability',
+        '_show_countdown', '_show_type', '_show_description', '_interval_samples',
+        'all_maneuvers', 'maneuvers', '_emergencies', '_non_emergencies', '_weighted_pool',
+        '_selector', '_selector_inputs', '_queue',
+        'tracker', 'include_emergencies', 'maneuver_kind', 'skipped_maneuvers',
+        'session_mode', 'emergency_mode', 'completed_maneuvers',
+    )
+    
     # Default interval settings
     DEFAULT_INTERVAL_MIN = 30
     DEFAULT_INTERVAL_MAX = 120
+    # Number of intervals drawn at a time by get_random_interval
+    INTERVAL_BATCH_SIZE = 32
+    
+    # Written after a wait to wipe the countdown/waiting line
+    _CLEAR_LINE = "\r" + " " * 50 + "\r"
+    
+    # Accepted responses for the session setup prompts, mapped to their result
+    _KIND_CHOICES = {
+        '': 'all', 'a': 'all', 'all': 'all',
+        'p': 'private', 'private': 'private',
+        'c': 'commercial', 'commercial': 'commercial',
+        'e': 'emergency', 'emergency': 'emergency', 'emergencies': 'emergency',
+    }
+    _SESSION_MODE_CHOICES = {
+        '': 'indefinite', 'i': 'indefinite', 'indefinite': 'indefinite',
+        'f': 'fixed', 'fixed': 'fixed',
+    }
+    _INCLUDE_EMERGENCIES_CHOICES = {
+        '': True, 'y': True, 'yes': True,
+        'n': False, 'no': False,
+    }
+    _EMERGENCY_MODE_CHOICES = {
+        '': 'all', 'a': 'all', 'all': 'all',
+        'r': 'random', 'random': 'random',
+    }
+    _CONFIRM_CHOICES = {
+        'y': True, 'yes': True,
+        'n': False, 'no': False,
+    }
+    
+    # Maneuver responses that are always accepted and their menu lines
+    _BASE_RESPONSES = ('f', 's', 'p', 'q')
+    _BASE_MENU = (
+        "  [f] Mark for review\n"
+        "  [s] Skip (no recording)\n"
+        "  [p] Permanently skip (remove from session)\n"
+        "  [q] Quit"
+    )
+    # Per extra option shown ('n' for Next, 'c' for Completed, or none): the
+    # accepted responses, the menu text and the choices listed on bad input
+    _RESPONSE_PROMPTS = {
+        'n': (frozenset(_BASE_RESPONSES + ('n',)),
+              "\nOptions:\n  [n] Next\n" + _BASE_MENU, ", ".join(_BASE_RESPONSES + ('n',))),
+        'c': (frozenset(_BASE_RESPONSES + ('c',)),
+              "\nOptions:\n  [c] Completed\n" + _BASE_MENU, ", ".join(_BASE_RESPONSES + ('c',))),
+        None: (frozenset(_BASE_RESPONSES),
+               "\nOptions:\n" + _BASE_MENU, ", ".join(_BASE_RESPONSES)),
+    }
+    # Responses that finish the current maneuver, mapped to the status to
+    # record (None to record nothing) and the confirmation message
+    _FINISH_RESPONSES = {
+        'c': ("completed", "✓ Marked as completed"),
+        'f': ("review", "⚠ Marked for review"),
+        's': (None, "Skipped (not recorded)"),
+    }
     
     def __init__(self, config_file: str = "config.json"):
         self.config_file = Path(config_file)
         self.config = self.load_config()
+        # Settings read on every maneuver, resolved once (Configuration is read-only)
+        self._interval_min = (self.config.interval_min_sec if self.config.interval_min_sec is not None
+                              else self.DEFAULT_INTERVAL_MIN)
+        self._interval_max = (self.config.interval_max_sec if self.config.interval_max_sec is not None
+                              else self.DEFAULT_INTERVAL_MAX)
+        self._emergency_probability = self.config.emergency_probability
+        self._show_countdown = self.config.show_next_maneuver_time
+        self._show_type = self.config.show_maneuver_type
+        self._show_description = self.config.show_maneuver_description
+        self._interval_samples: List[int] = []  # Pre-drawn intervals, see get_random_interval
         self.all_maneuvers = self.load_maneuvers()
         self.maneuvers = []  # Will be set based on user selection
+        self._emergencies = []  # Partitions of self.maneuvers, see _partition_maneuvers
+        self._non_emergencies = []
+        self._weighted_pool = None  # (population, cum_weights) used when emergency_probability is set
+        self._selector = None  # Selection function for the session, see _make_selector
+        self._selector_inputs = None  # (maneuvers, session_mode, emergency_mode) it was built for
+        self._queue = []  # Shuffled maneuvers still to practice in fixed-length sessions
         self.tracker = ManeuverTracker()
         self.include_emergencies = None
         self.maneuver_kind = None
@@ -187,15 +625,13 @@ class ChairFlying:
     
     def load_config(self) -> Configuration:
         """Load application configuration from JSON file."""
-        if not self.config_file.exists():
+        try:
+            config_dict = _load_json_file(self.config_file)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file '{self.config_file}' not found. "
                 "Please create it with your settings."
             )
-        
-        try:
-            with open(self.config_file, 'r') as f:
-                config_dict = json.load(f)
         except json.JSONDecodeError as e:
             raise ValueError(
                 f"Configuration file '{self.config_file}' contains invalid JSON: {e}"
@@ -212,26 +648,24 @@ class ChairFlying:
         """Load maneuvers from separate JSON file."""
         maneuvers_file = Path(self.config.maneuvers_file)
         
-        if not maneuvers_file.exists():
+        try:
+            maneuvers = _load_json_file(maneuvers_file)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Maneuvers file '{maneuvers_file}' not found. "
                 "Please create it with your maneuvers."
             )
-        
-        if not maneuvers_file.is_file():
-            raise ValueError(
-                f"Maneuvers file path '{maneuvers_file}' is not a file. "
-                "Please provide a valid file path."
-            )
-        
-        try:
-            with open(maneuvers_file, 'r') as f:
-                maneuvers = json.load(f)
         except json.JSONDecodeError as e:
             raise ValueError(
                 f"Maneuvers file '{maneuvers_file}' contains invalid JSON: {e}"
             )
         except IOError as e:
+            # Directories raise IsADirectoryError (PermissionError on Windows)
+            if maneuvers_file.is_dir():
+                raise ValueError(
+                    f"Maneuvers file path '{maneuvers_file}' is not a file. "
+                    "Please provide a valid file path."
+                )
             raise IOError(
                 f"Error reading maneuvers file '{maneuvers_file}': {e}"
             )
@@ -242,17 +676,53 @@ class ChairFlying:
         if not maneuvers:
             raise ValueError("Maneuvers file must contain at least one maneuver")
         
-        return maneuvers
+        # Normalize type and kind once so filtering and selection don't
+        # have to lowercase them on every pass. Each maneuver is copied first,
+        # since the parsed list is shared through the file cache.
+        # Interned so the few distinct values are shared by every maneuver
+        normalized = []
+        for m in maneuvers:
+            m = dict(m)
+            m["_type"] = sys.intern(m.get("type", "").lower())
+            m["_kind"] = sys.intern(m.get("kind", "").lower())
+            m["_is_emergency"] = m["_type"] == "emergency"
+            m["_has_phases"] = bool(m.get("phases"))
+            normalized.append(m)
+        
+        return normalized
     
     def is_manual_mode(self) -> bool:
         """Check if manual mode is enabled (no interval configuration)."""
         return self.config.is_manual_mode()
     
     def get_random_interval(self) -> int:
-        """Get random interval between min and max from config."""
-        min_interval = self.config.interval_min_sec if self.config.interval_min_sec is not None else self.DEFAULT_INTERVAL_MIN
-        max_interval = self.config.interval_max_sec if self.config.interval_max_sec is not None else self.DEFAULT_INTERVAL_MAX
-        return random.randint(min_interval, max_interval)
+        """Get random interval between min and max from config.
+        
+        Intervals are drawn in batches since the bounds never change during a
+        session.
+        """
+        if not self._interval_samples:
+            self._interval_samples = random.choices(
+                range(self._interval_min, self._interval_max + 1), k=self.INTERVAL_BATCH_SIZE
+            )
+        return self._interval_samples.pop()
+    
+    def _read_choice(self, prompt: str, choices: Dict, error_message: str):
+        """Read input until it matches one of the accepted choices.
+        
+        Args:
+            prompt: Text shown by input()
+            choices: Mapping of accepted (stripped, lowercase) responses to results
+            error_message: Message printed after an invalid response
+            
+        Returns:
+            The result mapped to the user's response
+        """
+        while True:
+            response = input(prompt).strip().lower()
+            if response in choices:
+                return choices[response]
+            print(error_message)
     
     def prompt_maneuver_kind(self) -> str:
         """Prompt user to select which kind of maneuvers to practice.
@@ -266,19 +736,11 @@ class ChairFlying:
         print("  [e] Emergencies only")
         print("  [a] All maneuvers (default)")
         
-        while True:
-            response = input("\nYour choice (p/c/e/a or Enter for all): ").strip().lower()
-            
-            if response == '' or response == 'a' or response == 'all':
-                return 'all'
-            elif response == 'p' or response == 'private':
-                return 'private'
-            elif response == 'c' or response == 'commercial':
-                return 'commercial'
-            elif response == 'e' or response == 'emergency' or response == 'emergencies':
-                return 'emergency'
-            else:
-                print("Invalid choice. Please select p, c, e, a, or press Enter for all.")
+        return self._read_choice(
+            "\nYour choice (p/c/e/a or Enter for all): ",
+            self._KIND_CHOICES,
+            "Invalid choice. Please select p, c, e, a, or press Enter for all.",
+        )
     
     def prompt_session_mode(self) -> str:
         """Prompt user to select session mode.
@@ -290,15 +752,11 @@ class ChairFlying:
         print("  [i] Indefinite - Practice maneuvers randomly (default)")
         print("  [f] Fixed-length - Practice each maneuver once")
         
-        while True:
-            response = input("\nYour choice (i/f or Enter for indefinite): ").strip().lower()
-            
-            if response == '' or response == 'i' or response == 'indefinite':
-                return 'indefinite'
-            elif response == 'f' or response == 'fixed':
-                return 'fixed'
-            else:
-                print("Invalid choice. Please select i, f, or press Enter for indefinite.")
+        return self._read_choice(
+            "\nYour choice (i/f or Enter for indefinite): ",
+            self._SESSION_MODE_CHOICES,
+            "Invalid choice. Please select i, f, or press Enter for indefinite.",
+        )
     
     def prompt_include_emergencies(self) -> bool:
         """Prompt user whether to include emergency scenarios.
@@ -310,15 +768,11 @@ class ChairFlying:
         print("  [y] Yes (default)")
         print("  [n] No")
         
-        while True:
-            response = input("\nYour choice (y/n or Enter for yes): ").strip().lower()
-            
-            if response == '' or response == 'y' or response == 'yes':
-                return True
-            elif response == 'n' or response == 'no':
-                return False
-            else:
-                print("Invalid choice. Please select y, n, or press Enter for yes.")
+        return self._read_choice(
+            "\nYour choice (y/n or Enter for yes): ",
+            self._INCLUDE_EMERGENCIES_CHOICES,
+            "Invalid choice. Please select y, n, or press Enter for yes.",
+        )
     
     def prompt_emergency_mode(self) -> str:
         """Prompt user how emergencies should appear in fixed-length sessions.
@@ -330,36 +784,33 @@ class ChairFlying:
         print("  [a] All emergencies - Every emergency will appear (default)")
         print("  [r] Random emergencies - Based on configured probability")
         
-        while True:
-            response = input("\nYour choice (a/r or Enter for all): ").strip().lower()
-            
-            if response == '' or response == 'a' or response == 'all':
-                return 'all'
-            elif response == 'r' or response == 'random':
-                return 'random'
-            else:
-                print("Invalid choice. Please select a, r, or press Enter for all.")
+        return self._read_choice(
+            "\nYour choice (a/r or Enter for all): ",
+            self._EMERGENCY_MODE_CHOICES,
+            "Invalid choice. Please select a, r, or press Enter for all.",
+        )
     
     def filter_maneuvers(self):
         """Filter maneuvers based on user preferences."""
-        filtered = self.all_maneuvers.copy()
-        
-        # Filter by kind
-        if self.maneuver_kind == 'emergency':
+        kind = self.maneuver_kind
+        if kind == 'emergency':
             # Only emergencies
-            filtered = [m for m in filtered if m.get("type", "").lower() == "emergency"]
-        elif self.maneuver_kind != 'all':
-            # Keep emergencies (they don't have a kind) and maneuvers matching the selected kind
+            filtered = [m for m in self.all_maneuvers if m["_is_emergency"]]
+        elif kind == 'all' and self.include_emergencies:
+            # Nothing to filter; self.maneuvers is only ever rebound, never
+            # mutated in place, so sharing the list is safe
+            filtered = self.all_maneuvers
+        elif kind == 'all':
+            filtered = [m for m in self.all_maneuvers if not m["_is_emergency"]]
+        else:
+            # Keep maneuvers matching the selected kind, plus emergencies (they
+            # don't have a kind) if the user chose to include them
+            include_emergencies = self.include_emergencies
             filtered = [
-                m for m in filtered
-                if m.get("type", "").lower() == "emergency" or 
-                   m.get("kind", "").lower() == self.maneuver_kind
+                m for m in self.all_maneuvers
+                if (include_emergencies if m["_is_emergency"] else m["_kind"] == kind)
             ]
         
-        # Filter out emergencies if user chose not to include them (only applicable when not emergency-only mode)
-        if not self.include_emergencies and self.maneuver_kind != 'emergency':
-            filtered = [m for m in filtered if m.get("type", "").lower() != "emergency"]
-        
         # Ensure we have at least one maneuver
         if not filtered:
             raise ValueError(
@@ -368,6 +819,7 @@ class ChairFlying:
             )
         
         self.maneuvers = filtered
+        self._partition_maneuvers()
     
     def select_maneuver(self) -> Dict:
         """Select a random maneuver from the maneuvers list.
@@ -378,61 +830,129 @@ class ChairFlying:
         
         For fixed-length sessions with all emergencies:
         - Selects from maneuvers not yet completed
+        
+        The selector is built on first use, and rebuilt if self.maneuvers,
+        session_mode or emergency_mode changed since it was built.
         """
         if not self.maneuvers:
             raise ValueError("No maneuvers configured!")
+        if self._selector is None:
+            self._partition_maneuvers()
+        else:
+            maneuvers, session_mode, emergency_mode = self._selector_inputs
+            if (maneuvers is not self.maneuvers or session_mode != self.session_mode
+                    or emergency_mode != self.emergency_mode):
+                self._partition_maneuvers()
+        return self._selector()
+    
+    def _make_selector(self) -> Callable[[], Optional[Dict]]:
+        """Build the selection function for the current session settings.
         
-        # Determine available maneuvers based on session mode
+        The session mode and emergency probability don't change once the session
+        starts, so the branching on them is done once here rather than per pick
+        (select_maneuver rebuilds the selector if the mode is changed anyway).
+        """
         if self.session_mode == 'fixed':
-            # For random emergencies mode, check if non-emergency maneuvers are completed
             if self.emergency_mode == 'random':
-                # Check if all non-emergency maneuvers are completed
-                non_emergency_maneuvers = [m for m in self.maneuvers if m.get("type", "").lower() != "emergency"]
-                non_emergency_completed = [m for m in self.completed_maneuvers if m.get("type", "").lower() != "emergency"]
-                if len(non_emergency_completed) >= len(non_emergency_maneuvers):
-                    return None  # All required maneuvers completed
-                # Available pool includes only non-completed non-emergency maneuvers plus all emergencies
-                non_emergency_available = [m for m in non_emergency_maneuvers if m not in self.completed_maneuvers]
-                emergency_maneuvers = [m for m in self.maneuvers if m.get("type", "").lower() == "emergency"]
-                available = non_emergency_available + emergency_maneuvers
-            else:
-                # For all emergencies mode, check if all maneuvers are completed
-                available = [m for m in self.maneuvers if m not in self.completed_maneuvers]
-                if not available:
-                    return None  # All maneuvers completed
-        else:
-            available = self.maneuvers
+                return self._select_fixed_random
+            # Every maneuver appears exactly once, so shuffle once and walk the queue
+            completed = {id(m) for m in self.completed_maneuvers}
+            self._queue = [m for m in self.maneuvers if id(m) not in completed]
+            random.shuffle(self._queue)
+            return self._next_in_queue
+        
+        # The closures capture the bound RNG methods so each pick skips the
+        # module attribute lookup
+        if self._emergency_probability is None:
+            maneuvers = self.maneuvers
+            choice = random.choice
+            return lambda: choice(maneuvers)
+        
+        population, cum_weights = self._weighted_pool
+        choices = random.choices
+        return lambda: choices(population, cum_weights=cum_weights)[0]
+    
+    def _next_in_queue(self) -> Optional[Dict]:
+        """Return the next maneuver of a fixed-length session's shuffled queue.
+        
+        The maneuver stays at the head of the queue until it is marked completed.
+        Maneuvers appended to completed_maneuvers directly, rather than through
+        mark_maneuver_completed, are dropped here when they reach the head.
+        
+        Returns:
+            Next maneuver, or None once every maneuver is completed
+        """
+        queue = self._queue
+        if queue:
+            completed = {id(m) for m in self.completed_maneuvers}
+            while queue and id(queue[-1]) in completed:
+                queue.pop()
+        return queue[-1] if queue else None
+    
+    def _select_fixed_random(self) -> Optional[Dict]:
+        """Select a maneuver for a fixed-length session with random emergencies.
         
-        # For fixed sessions with all emergencies mode, or no probability configured
-        if (self.session_mode == 'fixed' and self.emergency_mode == 'all') or \
-           self.config.emergency_probability is None:
-            return random.choice(available)
+        Only non-emergency maneuvers need completing; emergencies may repeat.
+        
+        Returns:
+            Selected maneuver, or None once every non-emergency maneuver is completed
+        """
+        # Identity set so each membership test below is O(1) rather than a list scan
+        completed = {id(m) for m in self.completed_maneuvers}
+        non_emergencies = [m for m in self._non_emergencies if id(m) not in completed]
+        if not non_emergencies:
+            return None  # All required maneuvers completed
+        
+        # No probability configured
+        if self._emergency_probability is None:
+            return random.choice(non_emergencies + self._emergencies)
         
         # Use weighted selection based on emergency_probability
-        return self._select_with_probability(available, self.config.emergency_probability)
+        population, cum_weights = self._build_weighted_pool(
+            self._emergencies, non_emergencies, self._emergency_probability
+        )
+        return random.choices(population, cum_weights=cum_weights)[0]
     
-    def _select_with_probability(self, maneuvers: List[Dict], emergency_prob: float) -> Dict:
-        """Select a maneuver using weighted probability for emergencies.
+    @staticmethod
+    def _build_weighted_pool(emergencies: List[Dict], non_emergencies: List[Dict],
+                             emergency_prob: float) -> Tuple[List[Dict], Optional[List[float]]]:
+        """Build the population and cumulative weights for emergency-weighted selection.
+        
+        Emergencies share emergency_prob of the total weight and non-emergencies
+        share the rest, spread evenly within each group.
         
         Args:
-            maneuvers: List of maneuvers to select from
+            emergencies: Emergency maneuvers to select from
+            non_emergencies: Non-emergency maneuvers to select from
             emergency_prob: Probability (0-1) of selecting an emergency
             
         Returns:
-            Selected maneuver
+            Tuple of (population, cum_weights) for random.choices. cum_weights is
+            None (uniform selection) when only one type is available.
         """
-        emergencies = [m for m in maneuvers if m.get("type", "").lower() == "emergency"]
-        non_emergencies = [m for m in maneuvers if m.get("type", "").lower() != "emergency"]
-        
         # If only one type available, select from that type
         if not emergencies or not non_emergencies:
-            return random.choice(maneuvers)
+            return emergencies or non_emergencies, None
         
-        # Use probability to determine maneuver type
-        if random.random() < emergency_prob:
-            return random.choice(emergencies)
-        else:
-            return random.choice(non_emergencies)
+        weights = (
+            [emergency_prob / len(emergencies)] * len(emergencies) +
+            [(1 - emergency_prob) / len(non_emergencies)] * len(non_emergencies)
+        )
+        return emergencies + non_emergencies, list(accumulate(weights))
+    
+    def _partition_maneuvers(self):
+        """Split the active maneuvers into emergency and non-emergency lists.
+        
+        Also rebuilds the selector. Must be called whenever self.maneuvers changes.
+        """
+        self._emergencies = [m for m in self.maneuvers if m["_is_emergency"]]
+        self._non_emergencies = [m for m in self.maneuvers if not m["_is_emergency"]]
+        if self._emergency_probability is not None:
+            self._weighted_pool = self._build_weighted_pool(
+                self._emergencies, self._non_emergencies, self._emergency_probability
+            )
+        self._selector = self._make_selector()
+        self._selector_inputs = (self.maneuvers, self.session_mode, self.emergency_mode)
     
     def select_phase(self, maneuver: Dict) -> Optional[Dict]:
         """Select a random phase from the maneuver's phases."""
@@ -442,24 +962,25 @@ class ChairFlying:
     
     def display_maneuver(self, maneuver: Dict, phase: Optional[Dict] = None):
         """Display maneuver information to the user."""
-        print("\n" + "=" * 60)
-        print(f"MANEUVER: {maneuver['name']}")
+        # Collect the lines and print them in a single call
+        lines = ["\n" + _RULE, f"MANEUVER: {maneuver['name']}"]
         
         # Show type if configured
-        if self.config.show_maneuver_type:
-            print(f"Type: {maneuver.get('type', 'normal').upper()}")
+        if self._show_type:
+            lines.append(f"Type: {maneuver.get('type', 'normal').upper()}")
         
         # Show description if configured and available
-        if self.config.show_maneuver_description and "description" in maneuver:
-            print(f"Description: {maneuver['description']}")
+        if self._show_description and "description" in maneuver:
+            lines.append(f"Description: {maneuver['description']}")
         
         # Show phase information if provided
         if phase:
-            print(f"\nPHASE: {phase['name']}")
-            if self.config.show_maneuver_description and "description" in phase:
-                print(f"Phase Description: {phase['description']}")
+            lines.append(f"\nPHASE: {phase['name']}")
+            if self._show_description and "description" in phase:
+                lines.append(f"Phase Description: {phase['description']}")
         
-        print("=" * 60)
+        lines.append(_RULE)
+        print("\n".join(lines))
     
     def get_user_response(self, show_next: bool = False, show_complete: bool = True) -> str:
         """Get user response for maneuver completion.
@@ -468,30 +989,17 @@ class ChairFlying:
             show_next: If True, shows [n] Next instead of [c] Completed
             show_complete: If True, shows [c] Completed (only used when show_next is False)
         """
+        extra = 'n' if show_next else 'c' if show_complete else None
+        accepted, menu, options = self._RESPONSE_PROMPTS[extra]
+        
         while True:
-            print("\nOptions:")
-            if show_next:
-                print("  [n] Next")
-            elif show_complete:
-                print("  [c] Completed")
-            print("  [f] Mark for review")
-            print("  [s] Skip (no recording)")
-            print("  [p] Permanently skip (remove from session)")
-            print("  [q] Quit")
+            print(menu)
             
             response = input("\nYour response: ").strip().lower()
             
-            valid_responses = ['f', 's', 'p', 'q']
-            if show_next:
-                valid_responses.append('n')
-            elif show_complete:
-                valid_responses.append('c')
-            
-            if response in valid_responses:
+            if response in accepted:
                 return response
-            else:
-                options = ", ".join(valid_responses)
-                print(f"Invalid input. Please choose {options}.")
+            print(f"Invalid input. Please choose {options}.")
     
     def confirm_permanent_skip(self, maneuver: Dict) -> bool:
         """Prompt user to confirm permanent skip of a maneuver.
@@ -505,14 +1013,11 @@ class ChairFlying:
         print(f"\n⚠️  Are you sure you want to permanently skip '{maneuver['name']}' for this session?")
         print("This maneuver will not appear again until you restart the application.")
         
-        while True:
-            response = input("Confirm (y/n): ").strip().lower()
-            if response in ['y', 'yes']:
-                return True
-            elif response in ['n', 'no']:
-                return False
-            else:
-                print("Invalid input. Please enter 'y' or 'n'.")
+        return self._read_choice(
+            "Confirm (y/n): ",
+            self._CONFIRM_CHOICES,
+            "Invalid input. Please enter 'y' or 'n'.",
+        )
     
     def permanently_skip_maneuver(self, maneuver: Dict):
         """Permanently skip a maneuver for the current session.
@@ -524,7 +1029,8 @@ class ChairFlying:
         self.skipped_maneuvers.append(maneuver)
         
         # Remove from active maneuvers list
-        self.maneuvers = [m for m in self.maneuvers if m != maneuver]
+        self.maneuvers = [m for m in self.maneuvers if m is not maneuver]
+        self._partition_maneuvers()
         
         print(f"✗ '{maneuver['name']}' has been permanently removed from this session.")
         
@@ -542,29 +1048,33 @@ class ChairFlying:
         input()
     
     def wait_with_countdown(self, interval: int):
-        """Wait for the specified interval with a countdown or progress indicator."""
-        show_countdown = self.config.show_next_maneuver_time
-        
-        if show_countdown:
-            # Show countdown timer
-            import sys
-            for remaining in range(interval, 0, -1):
-                sys.stdout.write(f"\rNext maneuver in {remaining} seconds...  ")
-                sys.stdout.flush()
-                time.sleep(1)
-            sys.stdout.write("\r" + " " * 50 + "\r")  # Clear the line
-            sys.stdout.flush()
+        """Wait for the specified interval with a countdown or progress indicator.
+        
+        Timing is based on a monotonic deadline so the wait doesn't drift when
+        redrawing the countdown takes time.
+        """
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        
+        if self._show_countdown:
+            # Show countdown timer, redrawing only when the displayed second changes.
+            # Lines are formatted up front so each tick only writes a ready string.
+            lines = tuple(f"\rNext maneuver in {r} seconds...  " for r in range(interval + 1))
+            deadline = time.monotonic() + interval
+            remaining = float(interval)
+            while remaining > 0:
+                seconds = math.ceil(remaining)
+                write(lines[seconds])
+                flush()
+                time.sleep(remaining - (seconds - 1))
+                remaining = deadline - time.monotonic()
         else:
-            # Show progress indicator (dots) without countdown
-            import sys
-            sys.stdout.write("\nWaiting")
-            sys.stdout.flush()
-            for i in range(interval):
-                time.sleep(1)
-                sys.stdout.write(".")
-                sys.stdout.flush()
-            sys.stdout.write("\r" + " " * 50 + "\r")  # Clear the line
-            sys.stdout.flush()
+            # Show a waiting indicator without countdown; nothing to redraw, so sleep once
+            write("\nWaiting...")
+            flush()
+            time.sleep(interval)
+        write(self._CLEAR_LINE)
+        flush()
     
     def mark_maneuver_completed(self, maneuver: Dict):
         """Mark a maneuver as completed in fixed-length mode.
@@ -572,8 +1082,15 @@ class ChairFlying:
         Args:
             maneuver: The maneuver to mark as completed
         """
-        if self.session_mode == 'fixed' and maneuver not in self.completed_maneuvers:
+        # Compared by identity, as in selection, so duplicate entries in the
+        # maneuvers file are each completed separately
+        if self.session_mode == 'fixed' and not any(m is maneuver for m in self.completed_maneuvers):
             self.completed_maneuvers.append(maneuver)
+            # Drop it from the shuffled queue; normally it is the head
+            if self._queue and self._queue[-1] is maneuver:
+                self._queue.pop()
+            else:
+                self._queue = [m for m in self._queue if m is not maneuver]
     
     def show_remaining_count(self):
         """Display remaining maneuvers count in fixed-length mode."""
@@ -581,8 +1098,8 @@ class ChairFlying:
             # For random emergencies mode, only count non-emergency maneuvers
             if self.emergency_mode == 'random':
                 # Count non-emergency maneuvers that haven't been completed
-                non_emergency_maneuvers = [m for m in self.maneuvers if m.get("type", "").lower() != "emergency"]
-                non_emergency_completed = [m for m in self.completed_maneuvers if m.get("type", "").lower() != "emergency"]
+                non_emergency_maneuvers = [m for m in self.maneuvers if not m["_is_emergency"]]
+                non_emergency_completed = [m for m in self.completed_maneuvers if not m["_is_emergency"]]
                 remaining = len(non_emergency_maneuvers) - len(non_emergency_completed)
             else:
                 # For all emergencies mode or no emergencies, count all maneuvers
@@ -594,16 +1111,16 @@ class ChairFlying:
     def show_config_summary(self):
         """Display a summary of all configuration options."""
         print("\nConfiguration Summary:")
-        print("-" * 60)
+        print(_THIN_RULE)
         
         # Maneuvers loaded
         total_maneuvers = len(self.maneuvers)
-        emergency_count = sum(1 for m in self.maneuvers if m.get("type", "").lower() == "emergency")
-        non_emergency_count = total_maneuvers - emergency_count
+        emergency_count = len(self._emergencies)
         
-        # Count by kind
-        private_count = sum(1 for m in self.maneuvers if m.get("kind", "").lower() == "private")
-        commercial_count = sum(1 for m in self.maneuvers if m.get("kind", "").lower() == "commercial")
+        # Count by kind in a single pass
+        kind_counts = Counter(m["_kind"] for m in self.maneuvers)
+        private_count = kind_counts["private"]
+        commercial_count = kind_counts["commercial"]
         
         print(f"Maneuvers loaded: {total_maneuvers}")
         print(f"  - Emergency maneuvers: {emergency_count}")
@@ -631,28 +1148,24 @@ class ChairFlying:
         if self.is_manual_mode():
             print(f"Timing mode: Manual (user-prompted)")
         else:
-            min_interval = self.config.interval_min_sec if self.config.interval_min_sec is not None else self.DEFAULT_INTERVAL_MIN
-            max_interval = self.config.interval_max_sec if self.config.interval_max_sec is not None else self.DEFAULT_INTERVAL_MAX
             print(f"Timing mode: Automatic")
-            print(f"Interval range: {min_interval}-{max_interval} seconds")
+            print(f"Interval range: {self._interval_min}-{self._interval_max} seconds")
         
         # Emergency probability setting
-        if self.config.emergency_probability is not None:
-            print(f"Emergency probability: {self.config.emergency_probability * 100}%")
+        if self._emergency_probability is not None:
+            print(f"Emergency probability: {self._emergency_probability * 100}%")
         
         # Display options
         print(f"Display options:")
-        print(f"  - Show countdown timer: {'Yes' if self.config.show_next_maneuver_time else 'No'}")
-        print(f"  - Show maneuver type: {'Yes' if self.config.show_maneuver_type else 'No'}")
-        print(f"  - Show descriptions: {'Yes' if self.config.show_maneuver_description else 'No'}")
+        print(f"  - Show countdown timer: {'Yes' if self._show_countdown else 'No'}")
+        print(f"  - Show maneuver type: {'Yes' if self._show_type else 'No'}")
+        print(f"  - Show descriptions: {'Yes' if self._show_description else 'No'}")
         
-        print("-" * 60)
+        print(_THIN_RULE)
     
     def run(self):
         """Run the main chair flying loop."""
-        print("=" * 60)
-        print("Chair Flying -  Checklist Memorization Aid")
-        print("=" * 60)
+        print(f"{_RULE}\nChair Flying -  Checklist Memorization Aid\n{_RULE}")
         
         # Prompt user for session mode
         self.session_mode = self.prompt_session_mode()
@@ -688,14 +1201,8 @@ class ChairFlying:
             # Count maneuvers that will definitely appear once
             if self.emergency_mode == 'random':
                 # Only count non-emergency maneuvers for fixed-length sessions with random emergencies
-                # Partition maneuvers into emergency and non-emergency in a single pass
-                emergency_count = 0
-                non_emergency_count = 0
-                for m in self.maneuvers:
-                    if m.get("type", "").lower() == "emergency":
-                        emergency_count += 1
-                    else:
-                        non_emergency_count += 1
+                emergency_count = len(self._emergencies)
+                non_emergency_count = len(self._non_emergencies)
                 print(f"You will practice {non_emergency_count} maneuver(s) once each.")
                 if emergency_count > 0:
                     print(f"(with the potential for any of the {emergency_count} emergency maneuver(s) to appear at random)")
@@ -705,17 +1212,26 @@ class ChairFlying:
         print("Press Ctrl+C to stop at any time.\n")
         
         try:
+            # Bind per-tick calls to locals; manual mode cannot change mid-session
+            manual_mode = self.is_manual_mode()
+            wait_for_user_ready = self.wait_for_user_ready
+            get_random_interval = self.get_random_interval
+            wait_with_countdown = self.wait_with_countdown
+            select_maneuver = self.select_maneuver
+            display_maneuver = self.display_maneuver
+            get_user_response = self.get_user_response
+            finish_responses = self._FINISH_RESPONSES
+            
             quit_requested = False
             while True:
                 # Wait for next maneuver - either with timer or user prompt
-                if self.is_manual_mode():
-                    self.wait_for_user_ready()
+                if manual_mode:
+                    wait_for_user_ready()
                 else:
-                    interval = self.get_random_interval()
-                    self.wait_with_countdown(interval)
+                    wait_with_countdown(get_random_interval())
                 
                 # Select and display maneuver
-                maneuver = self.select_maneuver()
+                maneuver = select_maneuver()
                 
                 # Check if all maneuvers are completed in fixed-length mode
                 if maneuver is None:
@@ -723,11 +1239,11 @@ class ChairFlying:
                     break  # Exit outer loop
                 
                 current_phase = None
-                has_phases = "phases" in maneuver and maneuver["phases"]
+                has_phases = maneuver["_has_phases"]
                 
                 # Inner loop for handling phases
                 while True:
-                    self.display_maneuver(maneuver, current_phase)
+                    display_maneuver(maneuver, current_phase)
                     
                     # Determine what options to show
                     # For multi-phase maneuvers without a phase selected, show "Next" instead of "Completed"
@@ -736,9 +1252,18 @@ class ChairFlying:
                     show_complete = not show_next
                     
                     # Get user response
-                    response = self.get_user_response(show_next=show_next, show_complete=show_complete)
+                    response = get_user_response(show_next=show_next, show_complete=show_complete)
                     
-                    if response == 'q':
+                    outcome = finish_responses.get(response)
+                    if outcome is not None:
+                        status, message = outcome
+                        if status is not None:
+                            self.tracker.record_maneuver(maneuver, status, current_phase)
+                        print(message)
+                        self.mark_maneuver_completed(maneuver)
+                        self.show_remaining_count()
+                        break
+                    elif response == 'q':
                         print("\nEnding practice session.")
                         quit_requested = True
                         break  # Exit inner loop
@@ -752,23 +1277,6 @@ class ChairFlying:
                             # This should never happen if has_phases check is working correctly
                             print("Error: No phases available. Proceeding to next maneuver.")
                             break
-                    elif response == 'c':
-                        self.tracker.record_maneuver(maneuver, "completed", current_phase)
-                        print("✓ Marked as completed")
-                        self.mark_maneuver_completed(maneuver)
-                        self.show_remaining_count()
-                        break
-                    elif response == 'f':
-                        self.tracker.record_maneuver(maneuver, "review", current_phase)
-                        print("⚠ Marked for review")
-                        self.mark_maneuver_completed(maneuver)
-                        self.show_remaining_count()
-                        break
-                    elif response == 's':
-                        print("Skipped (not recorded)")
-                        self.mark_maneuver_completed(maneuver)
-                        self.show_remaining_count()
-                        break
                     elif response == 'p':
                         # Permanently skip this maneuver
                         if self.confirm_permanent_skip(maneuver):
@@ -789,15 +1297,15 @@ class ChairFlying:
         
         except KeyboardInterrupt:
             print("\n\nSession interrupted.")
+        finally:
+            self.tracker.close()
         
         # Show summary
         self.show_summary()
     
     def show_summary(self):
         """Show session summary and follow-ups."""
-        print("\n" + "=" * 60)
-        print("SESSION SUMMARY")
-        print("=" * 60)
+        print(f"\n{_RULE}\nSESSION SUMMARY\n{_RULE}")
         
         follow_ups = self.tracker.get_follow_ups()
         if follow_ups:
@@ -807,13 +1315,11 @@ class ChairFlying:
         else:
             print("\nNo maneuvers marked for review.")
         
-        print(f"\nTotal history entries: {len(self.tracker.history)}")
+        print(f"\nTotal history entries: {self.tracker.count_entries()}")
 
 
 def main():
     """Entry point for the application."""
-    import sys
-    
     config_file = "config.json"
     
     # Allow custom config file as command line argument
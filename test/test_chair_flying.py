@@ -8,22 +8,41 @@ import json
 import tempfile
 import os
 import io
-import sys
+import random
+from collections import Counter
 from pathlib import Path
+from unittest import mock
+import chair_flying
 from chair_flying import ChairFlying, Configuration
 
 
+# Three commercial maneuvers and two emergencies, shared by the fixed-length session tests
+COMMERCIAL_AND_EMERGENCY_MANEUVERS = [
+    {"name": "Chandelles", "type": "maneuver", "kind": "commercial"},
+    {"name": "Lazy Eights", "type": "maneuver", "kind": "commercial"},
+    {"name": "Steep Turns", "type": "maneuver", "kind": "commercial"},
+    {"name": "Engine Failure", "type": "emergency"},
+    {"name": "Electrical Fire", "type": "emergency"},
+]
+
+
 class TestChairFlying(unittest.TestCase):
     """Test cases for ChairFlying class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create temporary config file
-        self.temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_maneuvers = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test.
+        
+        The baseline files are only read by the tests, so they are written once
+        for the whole class. Tests that need different files create their own.
+        """
+        # Both baseline files live in one temporary directory
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.config_path = os.path.join(cls.temp_dir.name, "config.json")
+        cls.maneuvers_path = os.path.join(cls.temp_dir.name, "maneuvers.json")
         
         # Create test maneuvers
-        self.test_maneuvers = [
+        cls.test_maneuvers = [
             {
                 "name": "Power-Off Stall",
                 "type": "maneuver",
@@ -43,12 +62,15 @@ class TestChairFlying(unittest.TestCase):
             }
         ]
         
-        json.dump(self.test_maneuvers, self.temp_maneuvers)
-        self.temp_maneuvers.close()
+        Path(cls.maneuvers_path).write_text(json.dumps(cls.test_maneuvers))
+        
+        # Maneuvers for the fixed-length session tests, see _fixed_commercial_app
+        cls.commercial_maneuvers_path = os.path.join(cls.temp_dir.name, "commercial_maneuvers.json")
+        Path(cls.commercial_maneuvers_path).write_text(json.dumps(COMMERCIAL_AND_EMERGENCY_MANEUVERS))
         
         # Create test config
-        self.test_config = {
-            "maneuvers_file": self.temp_maneuvers.name,
+        cls.test_config = {
+            "maneuvers_file": cls.maneuvers_path,
             "interval_min_sec": 30,
             "interval_max_sec": 120,
             "show_next_maneuver_time": True,
@@ -56,19 +78,55 @@ class TestChairFlying(unittest.TestCase):
             "show_maneuver_description": True
         }
         
-        json.dump(self.test_config, self.temp_config)
-        self.temp_config.close()
+        Path(cls.config_path).write_text(json.dumps(cls.test_config))
+        
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared fixtures."""
+        cls.temp_dir.cleanup()
+    
+    def _write_files(self, tmp_dir, config, maneuvers=None):
+        """Write a config file, and optionally a maneuvers file, into tmp_dir.
+        
+        Args:
+            tmp_dir: Directory to write the files into
+            config: Configuration dictionary to write
+            maneuvers: If given, written as the maneuvers file that config points to
+            
+        Returns:
+            Path of the written config file
+        """
+        if maneuvers is not None:
+            maneuvers_path = os.path.join(tmp_dir, "maneuvers.json")
+            Path(maneuvers_path).write_text(json.dumps(maneuvers))
+            config = dict(config, maneuvers_file=maneuvers_path)
+        
+        config_path = os.path.join(tmp_dir, "config.json")
+        Path(config_path).write_text(json.dumps(config))
+        return config_path
+    
+    def _fixed_commercial_app(self, emergency_mode):
+        """Create an app for a fixed-length commercial session with emergencies.
         
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if os.path.exists(self.temp_config.name):
-            os.unlink(self.temp_config.name)
-        if os.path.exists(self.temp_maneuvers.name):
-            os.unlink(self.temp_maneuvers.name)
+        Uses COMMERCIAL_AND_EMERGENCY_MANEUVERS, filtered and ready for selection.
+        """
+        config_data = {
+            "maneuvers_file": self.commercial_maneuvers_path,
+            "interval_min_sec": 5,
+            "interval_max_sec": 20
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            app = ChairFlying(self._write_files(tmp_dir, config_data))
+        app.session_mode = 'fixed'
+        app.maneuver_kind = 'commercial'
+        app.include_emergencies = True
+        app.emergency_mode = emergency_mode
+        app.filter_maneuvers()
+        return app
     
     def test_load_config_valid(self):
         """Test loading valid configuration."""
-        app = ChairFlying(self.temp_config.name)
+        app = ChairFlying(self.config_path)
         self.assertIsNotNone(app.config)
         self.assertEqual(app.config.interval_min_sec, 30)
         self.assertEqual(app.config.interval_max_sec, 120)
@@ -80,141 +138,143 @@ class TestChairFlying(unittest.TestCase):
     
     def test_load_maneuvers_valid(self):
         """Test loading valid maneuvers."""
-        app = ChairFlying(self.temp_config.name)
+        app = ChairFlying(self.config_path)
         self.assertEqual(len(app.all_maneuvers), 3)
         self.assertEqual(app.all_maneuvers[0]["name"], "Power-Off Stall")
     
+    def test_load_maneuvers_missing_file(self):
+        """Test loading maneuvers from a non-existent file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = self._write_files(tmp_dir, {"maneuvers_file": "nonexistent_maneuvers.json"})
+            with self.assertRaises(FileNotFoundError) as context:
+                ChairFlying(config_path)
+            self.assertIn("nonexistent_maneuvers.json", str(context.exception))
+    
+    def test_load_maneuvers_directory(self):
+        """Test loading maneuvers from a path that is a directory."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = self._write_files(tmp_dir, {"maneuvers_file": tmp_dir})
+            with self.assertRaises(ValueError) as context:
+                ChairFlying(config_path)
+            self.assertIn("is not a file", str(context.exception))
+    
+    def test_load_reuses_parsed_files_until_changed(self):
+        """Test that unchanged files are parsed once and changed files are re-read."""
+        # Uses its own files since it rewrites the maneuvers file
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+             mock.patch("chair_flying._loads", wraps=chair_flying._loads) as loads_mock:
+            config_path = self._write_files(tmp_dir, {}, self.test_maneuvers)
+            app1 = ChairFlying(config_path)
+            app2 = ChairFlying(config_path)
+            # Config and maneuvers are each parsed once...
+            self.assertEqual(loads_mock.call_count, 2)
+            # ...but every instance normalizes its own copy of the maneuvers
+            self.assertIsNot(app1.all_maneuvers[0], app2.all_maneuvers[0])
+            
+            Path(app1.config.maneuvers_file).write_text(
+                json.dumps([{"name": "Steep Turns", "type": "maneuver", "kind": "private"}]))
+            
+            app3 = ChairFlying(config_path)
+            self.assertEqual(loads_mock.call_count, 3)
+            self.assertEqual([m["name"] for m in app3.all_maneuvers], ["Steep Turns"])
+    
+    def test_load_maneuvers_normalizes_type_and_kind(self):
+        """Test that type and kind are normalized once at load time."""
+        maneuvers = [
+            {"name": "Chandelles", "type": "Maneuver", "kind": "Commercial"},
+            {"name": "Engine Failure", "type": "EMERGENCY", "phases": [{"name": "Takeoff"}]},
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            app = ChairFlying(self._write_files(tmp_dir, {}, maneuvers))
+        
+        chandelles, engine_failure = app.all_maneuvers
+        self.assertEqual(chandelles["_kind"], "commercial")
+        self.assertFalse(chandelles["_is_emergency"])
+        self.assertEqual(engine_failure["_kind"], "")
+        self.assertTrue(engine_failure["_is_emergency"])
+        self.assertFalse(chandelles["_has_phases"])
+        self.assertTrue(engine_failure["_has_phases"])
+    
     def test_load_maneuvers_invalid_json(self):
         """Test loading maneuvers with invalid JSON."""
-        # Create config pointing to invalid maneuvers file
-        temp_invalid = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        temp_invalid.write("{ invalid json }")
-        temp_invalid.close()
-        
-        temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        config_data = {
-            "maneuvers_file": temp_invalid.name,
-            "interval_min_sec": 30,
-            "interval_max_sec": 120
-        }
-        json.dump(config_data, temp_config)
-        temp_config.close()
-        
-        try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Create config pointing to invalid maneuvers file
+            invalid_path = os.path.join(tmp_dir, "invalid.json")
+            Path(invalid_path).write_text("{ invalid json }")
+            config_data = {
+                "maneuvers_file": invalid_path,
+                "interval_min_sec": 30,
+                "interval_max_sec": 120
+            }
+            config_path = self._write_files(tmp_dir, config_data)
+            
             with self.assertRaises(ValueError) as context:
-                ChairFlying(temp_config.name)
+                ChairFlying(config_path)
             self.assertIn("invalid JSON", str(context.exception))
-        finally:
-            os.unlink(temp_invalid.name)
-            os.unlink(temp_config.name)
     
     def test_load_maneuvers_empty_array(self):
         """Test loading maneuvers with empty array."""
-        # Create empty maneuvers file
-        temp_empty = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        json.dump([], temp_empty)
-        temp_empty.close()
-        
-        temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
         config_data = {
-            "maneuvers_file": temp_empty.name,
             "interval_min_sec": 30,
             "interval_max_sec": 120
         }
-        json.dump(config_data, temp_config)
-        temp_config.close()
-        
-        try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = self._write_files(tmp_dir, config_data, [])
             with self.assertRaises(ValueError) as context:
-                ChairFlying(temp_config.name)
+                ChairFlying(config_path)
             self.assertIn("at least one maneuver", str(context.exception))
-        finally:
-            os.unlink(temp_empty.name)
-            os.unlink(temp_config.name)
     
     def test_is_manual_mode_automatic(self):
         """Test manual mode detection for automatic mode."""
-        app = ChairFlying(self.temp_config.name)
+        app = ChairFlying(self.config_path)
         self.assertFalse(app.is_manual_mode())
     
     def test_is_manual_mode_manual(self):
         """Test manual mode detection for manual mode."""
         # Create config without intervals
-        temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
         config_data = {
-            "maneuvers_file": self.temp_maneuvers.name
+            "maneuvers_file": self.maneuvers_path
         }
-        json.dump(config_data, temp_config)
-        temp_config.close()
-        
-        try:
-            app = ChairFlying(temp_config.name)
-            self.assertTrue(app.is_manual_mode())
-        finally:
-            os.unlink(temp_config.name)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            app = ChairFlying(self._write_files(tmp_dir, config_data))
+        self.assertTrue(app.is_manual_mode())
     
     def test_get_random_interval(self):
         """Test random interval generation."""
-        app = ChairFlying(self.temp_config.name)
+        app = ChairFlying(self.config_path)
         interval = app.get_random_interval()
         self.assertGreaterEqual(interval, 30)
         self.assertLessEqual(interval, 120)
     
-    def test_filter_maneuvers_all(self):
-        """Test filtering maneuvers with 'all' selection."""
-        app = ChairFlying(self.temp_config.name)
-        app.maneuver_kind = 'all'
-        app.include_emergencies = True
-        app.filter_maneuvers()
-        self.assertEqual(len(app.maneuvers), 3)
+    def test_get_random_interval_refills_batch(self):
+        """Test that intervals stay in range across more than one batch."""
+        app = ChairFlying(self.config_path)
+        intervals = [app.get_random_interval() for _ in range(ChairFlying.INTERVAL_BATCH_SIZE * 2 + 1)]
+        self.assertTrue(all(30 <= interval <= 120 for interval in intervals))
     
-    def test_filter_maneuvers_private_only(self):
-        """Test filtering maneuvers with 'private' selection."""
-        app = ChairFlying(self.temp_config.name)
-        app.maneuver_kind = 'private'
-        app.include_emergencies = True
-        app.filter_maneuvers()
-        # Should include private maneuvers and emergencies
-        self.assertEqual(len(app.maneuvers), 2)
-        names = [m["name"] for m in app.maneuvers]
-        self.assertIn("Power-Off Stall", names)
-        self.assertIn("Engine Failure", names)
-    
-    def test_filter_maneuvers_commercial_only(self):
-        """Test filtering maneuvers with 'commercial' selection."""
-        app = ChairFlying(self.temp_config.name)
-        app.maneuver_kind = 'commercial'
-        app.include_emergencies = True
-        app.filter_maneuvers()
-        # Should include commercial maneuvers and emergencies
-        self.assertEqual(len(app.maneuvers), 2)
-        names = [m["name"] for m in app.maneuvers]
-        self.assertIn("Chandelles", names)
-        self.assertIn("Engine Failure", names)
-    
-    def test_filter_maneuvers_emergency_only(self):
-        """Test filtering maneuvers with 'emergency' selection."""
-        app = ChairFlying(self.temp_config.name)
-        app.maneuver_kind = 'emergency'
-        app.include_emergencies = True  # Implied when emergency-only
-        app.filter_maneuvers()
-        self.assertEqual(len(app.maneuvers), 1)
-        self.assertEqual(app.maneuvers[0]["name"], "Engine Failure")
-    
-    def test_filter_maneuvers_exclude_emergencies(self):
-        """Test filtering maneuvers excluding emergencies."""
-        app = ChairFlying(self.temp_config.name)
-        app.maneuver_kind = 'all'
-        app.include_emergencies = False
-        app.filter_maneuvers()
-        # Should only include non-emergency maneuvers
-        self.assertEqual(len(app.maneuvers), 2)
-        for maneuver in app.maneuvers:
-            self.assertNotEqual(maneuver.get("type", "").lower(), "emergency")
+    def test_filter_maneuvers(self):
+        """Test filtering maneuvers by kind with and without emergencies."""
+        # Filtering only reads all_maneuvers, so one instance serves every case
+        app = ChairFlying(self.config_path)
+        cases = [
+            ('all', True, ["Power-Off Stall", "Chandelles", "Engine Failure"]),
+            # Kind filters keep emergencies alongside the matching maneuvers
+            ('private', True, ["Power-Off Stall", "Engine Failure"]),
+            ('commercial', True, ["Chandelles", "Engine Failure"]),
+            ('emergency', True, ["Engine Failure"]),  # Emergencies implied
+            ('all', False, ["Power-Off Stall", "Chandelles"]),
+            ('private', False, ["Power-Off Stall"]),
+        ]
+        for kind, include_emergencies, expected_names in cases:
+            with self.subTest(kind=kind, include_emergencies=include_emergencies):
+                app.maneuver_kind = kind
+                app.include_emergencies = include_emergencies
+                app.filter_maneuvers()
+                self.assertEqual([m["name"] for m in app.maneuvers], expected_names)
     
     def test_select_maneuver_basic(self):
         """Test basic maneuver selection."""
-        app = ChairFlying(self.temp_config.name)
+        app = ChairFlying(self.config_path)
         app.maneuver_kind = 'all'
         app.include_emergencies = True
         app.filter_maneuvers()
@@ -223,47 +283,197 @@ class TestChairFlying(unittest.TestCase):
         self.assertIsNotNone(maneuver)
         self.assertIn("name", maneuver)
     
+    def test_select_maneuver_without_filtering(self):
+        """Test that maneuvers assigned directly can be selected without filter_maneuvers()."""
+        app = ChairFlying(self.config_path)
+        app.maneuvers = list(app.all_maneuvers)
+        self.assertIn(app.select_maneuver(), app.maneuvers)
+    
+    def test_select_maneuver_follows_mode_change_after_filtering(self):
+        """Test that changing the session mode after filtering takes effect."""
+        app = ChairFlying(self.config_path)
+        app.maneuver_kind = 'all'
+        app.include_emergencies = True
+        app.session_mode = 'indefinite'
+        app.filter_maneuvers()
+        
+        app.session_mode = 'fixed'
+        app.emergency_mode = 'all'
+        for maneuver in app.all_maneuvers:
+            app.mark_maneuver_completed(maneuver)
+        self.assertIsNone(app.select_maneuver())
+    
     def test_select_maneuver_with_probability(self):
         """Test maneuver selection with emergency probability."""
         # Create config with emergency probability
-        temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
         config_data = {
-            "maneuvers_file": self.temp_maneuvers.name,
+            "maneuvers_file": self.maneuvers_path,
             "interval_min_sec": 30,
             "interval_max_sec": 120,
             "emergency_probability": 0.5
         }
-        json.dump(config_data, temp_config)
-        temp_config.close()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            app = ChairFlying(self._write_files(tmp_dir, config_data))
+        app.maneuver_kind = 'all'
+        app.include_emergencies = True
+        app.filter_maneuvers()
+        
+        # Seed the RNG so the mix of outcomes is deterministic; restore the
+        # global state afterwards so other tests aren't affected
+        self.addCleanup(random.setstate, random.getstate())
+        random.seed(1)
+        
+        selections = []
+        for _ in range(2):
+            maneuver = app.select_maneuver()
+            selections.append(maneuver.get("type", "").lower())
         
-        try:
-            app = ChairFlying(temp_config.name)
+        # Should have mix of emergency and non-emergency
+        self.assertIn("emergency", selections)
+        self.assertTrue(any(t != "emergency" for t in selections))
+    
+    def test_select_maneuver_probability_extremes(self):
+        """Test that probabilities of 0 and 1 never/always select emergencies."""
+        for probability, expect_emergency in ((0, False), (1, True)):
+            config_data = {
+                "maneuvers_file": self.maneuvers_path,
+                "emergency_probability": probability
+            }
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                app = ChairFlying(self._write_files(tmp_dir, config_data))
             app.maneuver_kind = 'all'
             app.include_emergencies = True
             app.filter_maneuvers()
             
-            # Test multiple selections to ensure probability works
-            selections = []
             for _ in range(20):
                 maneuver = app.select_maneuver()
-                selections.append(maneuver.get("type", "").lower())
-            
-            # Should have mix of emergency and non-emergency
-            self.assertIn("emergency", selections)
-            self.assertTrue(any(t != "emergency" for t in selections))
-        finally:
-            os.unlink(temp_config.name)
+                self.assertEqual(maneuver["_is_emergency"], expect_emergency)
+    
+    def test_prompt_maneuver_kind_accepts_aliases(self):
+        """Test that the maneuver kind prompt maps shortcuts and full words."""
+        app = ChairFlying(self.config_path)
+        cases = [("", "all"), ("A", "all"), ("p", "private"), ("Commercial", "commercial"),
+                 ("emergencies", "emergency")]
+        for response, expected in cases:
+            with mock.patch("builtins.input", return_value=response), \
+                 mock.patch("sys.stdout", io.StringIO()):
+                self.assertEqual(app.prompt_maneuver_kind(), expected)
+    
+    def test_prompt_include_emergencies_reprompts_on_invalid(self):
+        """Test that invalid responses are rejected until a valid one is given."""
+        app = ChairFlying(self.config_path)
+        captured_output = io.StringIO()
+        with mock.patch("builtins.input", side_effect=["maybe", "no"]), \
+             mock.patch("sys.stdout", captured_output):
+            self.assertFalse(app.prompt_include_emergencies())
+        self.assertIn("Invalid choice", captured_output.getvalue())
+    
+    def test_show_config_summary_counts(self):
+        """Test that the configuration summary counts maneuvers by category."""
+        app = ChairFlying(self.config_path)
+        app.maneuver_kind = 'all'
+        app.include_emergencies = True
+        app.session_mode = 'indefinite'
+        app.filter_maneuvers()
+        
+        captured_output = io.StringIO()
+        with mock.patch("sys.stdout", captured_output):
+            app.show_config_summary()
+        
+        output = captured_output.getvalue()
+        self.assertIn("Maneuvers loaded: 3", output)
+        self.assertIn("Emergency maneuvers: 1", output)
+        self.assertIn("Private pilot maneuvers: 1", output)
+        self.assertIn("Commercial pilot maneuvers: 1", output)
+    
+    def test_display_maneuver_with_phase(self):
+        """Test that maneuver and phase details are displayed."""
+        app = ChairFlying(self.config_path)
+        maneuver = {"name": "Engine Failure", "type": "emergency", "description": "Engine quits"}
+        phase = {"name": "Takeoff", "description": "Below 500 ft"}
+        
+        captured_output = io.StringIO()
+        with mock.patch("sys.stdout", captured_output):
+            app.display_maneuver(maneuver, phase)
+        
+        output = captured_output.getvalue()
+        for text in ("MANEUVER: Engine Failure", "Type: EMERGENCY", "Description: Engine quits",
+                     "PHASE: Takeoff", "Phase Description: Below 500 ft"):
+            self.assertIn(text, output)
+    
+    def test_get_user_response_accepts_only_shown_options(self):
+        """Test that 'c' and 'n' are only accepted when their option is shown."""
+        app = ChairFlying(self.config_path)
+        captured_output = io.StringIO()
+        with mock.patch("builtins.input", side_effect=["c", " N "]), \
+             mock.patch("sys.stdout", captured_output):
+            self.assertEqual(app.get_user_response(show_next=True), 'n')
+        self.assertIn("Invalid input. Please choose f, s, p, q, n.", captured_output.getvalue())
+        self.assertIn("[n] Next", captured_output.getvalue())
+        self.assertNotIn("[c] Completed", captured_output.getvalue())
+        
+        with mock.patch("builtins.input", side_effect=["n", "c"]), \
+             mock.patch("sys.stdout", io.StringIO()):
+            self.assertEqual(app.get_user_response(), 'c')
+    
+    def test_confirm_permanent_skip(self):
+        """Test that permanent skip confirmation accepts yes/no answers."""
+        app = ChairFlying(self.config_path)
+        maneuver = {"name": "Chandelles", "type": "maneuver"}
+        for responses, expected in ((["YES"], True), (["x", "n"], False)):
+            with mock.patch("builtins.input", side_effect=responses), \
+                 mock.patch("sys.stdout", io.StringIO()):
+                self.assertEqual(app.confirm_permanent_skip(maneuver), expected)
+    
+    def _fake_clock(self):
+        """Return (monotonic, sleep) fakes that advance a shared clock."""
+        clock = [0.0]
+        
+        def monotonic():
+            return clock[0]
+        
+        def sleep(seconds):
+            clock[0] += seconds
+        
+        return monotonic, sleep
+    
+    def test_wait_with_countdown_shows_each_second(self):
+        """Test that the countdown redraws once per second until the deadline."""
+        app = ChairFlying(self.config_path)
+        monotonic, sleep = self._fake_clock()
+        
+        captured_output = io.StringIO()
+        with mock.patch("chair_flying.time.monotonic", side_effect=monotonic), \
+             mock.patch("chair_flying.time.sleep", side_effect=sleep) as sleep_mock, \
+             mock.patch("sys.stdout", captured_output):
+            app.wait_with_countdown(3)
+        
+        output = captured_output.getvalue()
+        for remaining in (3, 2, 1):
+            self.assertIn(f"Next maneuver in {remaining} seconds", output)
+        self.assertEqual(sleep_mock.call_count, 3)
+        self.assertAlmostEqual(sum(c[0][0] for c in sleep_mock.call_args_list), 3)
+    
+    def test_wait_with_countdown_single_sleep_without_countdown(self):
+        """Test that waiting without a countdown sleeps once for the whole interval."""
+        config_data = dict(self.test_config, show_next_maneuver_time=False)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            app = ChairFlying(self._write_files(tmp_dir, config_data))
+        with mock.patch("chair_flying.time.sleep") as sleep_mock, \
+             mock.patch("sys.stdout", io.StringIO()):
+            app.wait_with_countdown(5)
+        sleep_mock.assert_called_once_with(5)
     
     def test_select_phase_no_phases(self):
         """Test phase selection for maneuver without phases."""
-        app = ChairFlying(self.temp_config.name)
+        app = ChairFlying(self.config_path)
         maneuver = {"name": "Test", "type": "maneuver"}
         phase = app.select_phase(maneuver)
         self.assertIsNone(phase)
     
     def test_select_phase_with_phases(self):
         """Test phase selection for maneuver with phases."""
-        app = ChairFlying(self.temp_config.name)
+        app = ChairFlying(self.config_path)
         maneuver = {
             "name": "Engine Fire",
             "type": "emergency",
@@ -279,7 +489,7 @@ class TestChairFlying(unittest.TestCase):
     
     def test_permanently_skip_maneuver(self):
         """Test permanently skipping a maneuver."""
-        app = ChairFlying(self.temp_config.name)
+        app = ChairFlying(self.config_path)
         app.maneuver_kind = 'all'
         app.include_emergencies = True
         app.filter_maneuvers()
@@ -294,9 +504,23 @@ class TestChairFlying(unittest.TestCase):
         self.assertIn(maneuver_to_skip, app.skipped_maneuvers)
         self.assertNotIn(maneuver_to_skip, app.maneuvers)
     
+    def test_select_maneuver_excludes_permanently_skipped(self):
+        """Test that a permanently skipped maneuver is never selected again."""
+        app = ChairFlying(self.config_path)
+        app.maneuver_kind = 'all'
+        app.include_emergencies = True
+        app.filter_maneuvers()
+        
+        maneuver_to_skip = app.maneuvers[0]
+        with mock.patch("sys.stdout", io.StringIO()):
+            app.permanently_skip_maneuver(maneuver_to_skip)
+        
+        for _ in range(20):
+            self.assertIsNot(app.select_maneuver(), maneuver_to_skip)
+    
     def test_permanently_skip_last_maneuver(self):
         """Test permanently skipping the last remaining maneuver."""
-        app = ChairFlying(self.temp_config.name)
+        app = ChairFlying(self.config_path)
         app.maneuver_kind = 'emergency'
         app.include_emergencies = True
         app.filter_maneuvers()
@@ -312,305 +536,200 @@ class TestChairFlying(unittest.TestCase):
     
     def test_fixed_length_session_maneuver_count(self):
         """Test that fixed-length session with random emergencies counts correctly."""
-        # Create a setup with multiple commercial and emergency maneuvers
-        temp_maneuvers = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        maneuvers = [
-            {"name": "Chandelles", "type": "maneuver", "kind": "commercial"},
-            {"name": "Lazy Eights", "type": "maneuver", "kind": "commercial"},
-            {"name": "Steep Turns", "type": "maneuver", "kind": "commercial"},
-            {"name": "Engine Failure", "type": "emergency"},
-            {"name": "Electrical Fire", "type": "emergency"},
-        ]
-        json.dump(maneuvers, temp_maneuvers)
-        temp_maneuvers.close()
+        app = self._fixed_commercial_app('random')
         
-        temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        config_data = {
-            "maneuvers_file": temp_maneuvers.name,
-            "interval_min_sec": 5,
-            "interval_max_sec": 20
-        }
-        json.dump(config_data, temp_config)
-        temp_config.close()
+        # Should have 3 commercial + 2 emergency = 5 total
+        self.assertEqual(len(app.maneuvers), 5)
         
-        try:
-            app = ChairFlying(temp_config.name)
-            app.session_mode = 'fixed'
-            app.maneuver_kind = 'commercial'
-            app.include_emergencies = True
-            app.emergency_mode = 'random'
-            app.filter_maneuvers()
-            
-            # Should have 3 commercial + 2 emergency = 5 total
-            self.assertEqual(len(app.maneuvers), 5)
-            
-            # Count non-emergency and emergency maneuvers in a single pass
-            emergency_count = 0
-            non_emergency_count = 0
-            for m in app.maneuvers:
-                if m.get("type", "").lower() == "emergency":
-                    emergency_count += 1
-                else:
-                    non_emergency_count += 1
-            
-            self.assertEqual(non_emergency_count, 3)
-            self.assertEqual(emergency_count, 2)
-        finally:
-            os.unlink(temp_maneuvers.name)
-            os.unlink(temp_config.name)
+        counts = Counter(m["_is_emergency"] for m in app.maneuvers)
+        self.assertEqual(counts[False], 3)
+        self.assertEqual(counts[True], 2)
     
     def test_show_remaining_count_fixed_random_emergencies(self):
         """Test that remaining count excludes emergencies in fixed mode with random emergencies."""
-        # Create a setup with multiple commercial and emergency maneuvers
-        temp_maneuvers = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        maneuvers = [
-            {"name": "Chandelles", "type": "maneuver", "kind": "commercial"},
-            {"name": "Lazy Eights", "type": "maneuver", "kind": "commercial"},
-            {"name": "Steep Turns", "type": "maneuver", "kind": "commercial"},
-            {"name": "Engine Failure", "type": "emergency"},
-            {"name": "Electrical Fire", "type": "emergency"},
-        ]
-        json.dump(maneuvers, temp_maneuvers)
-        temp_maneuvers.close()
+        app = self._fixed_commercial_app('random')
         
-        temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        config_data = {
-            "maneuvers_file": temp_maneuvers.name,
-            "interval_min_sec": 5,
-            "interval_max_sec": 20
-        }
-        json.dump(config_data, temp_config)
-        temp_config.close()
+        # Mark one non-emergency maneuver as completed
+        app.completed_maneuvers.append(app.maneuvers[0])  # Chandelles
         
-        try:
-            app = ChairFlying(temp_config.name)
-            app.session_mode = 'fixed'
-            app.maneuver_kind = 'commercial'
-            app.include_emergencies = True
-            app.emergency_mode = 'random'
-            app.filter_maneuvers()
-            
-            # Mark one non-emergency maneuver as completed
-            app.completed_maneuvers.append(app.maneuvers[0])  # Chandelles
-            
-            # Capture the output
-            captured_output = io.StringIO()
-            sys.stdout = captured_output
-            
+        # Capture the output
+        captured_output = io.StringIO()
+        with mock.patch("sys.stdout", captured_output):
             app.show_remaining_count()
-            
-            sys.stdout = sys.__stdout__
-            output = captured_output.getvalue()
-            
-            # Should show 2 remaining (3 commercial - 1 completed), not 4 (5 total - 1 completed)
-            self.assertIn("2 maneuver(s) remaining", output)
-            self.assertNotIn("4 maneuver(s) remaining", output)
-        finally:
-            os.unlink(temp_maneuvers.name)
-            os.unlink(temp_config.name)
+        output = captured_output.getvalue()
+        
+        # Should show 2 remaining (3 commercial - 1 completed), not 4 (5 total - 1 completed)
+        self.assertIn("2 maneuver(s) remaining", output)
+        self.assertNotIn("4 maneuver(s) remaining", output)
     
     def test_show_remaining_count_fixed_all_emergencies(self):
         """Test that remaining count includes emergencies in fixed mode with all emergencies."""
-        # Create a setup with multiple commercial and emergency maneuvers
-        temp_maneuvers = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        maneuvers = [
-            {"name": "Chandelles", "type": "maneuver", "kind": "commercial"},
-            {"name": "Lazy Eights", "type": "maneuver", "kind": "commercial"},
-            {"name": "Steep Turns", "type": "maneuver", "kind": "commercial"},
-            {"name": "Engine Failure", "type": "emergency"},
-            {"name": "Electrical Fire", "type": "emergency"},
-        ]
-        json.dump(maneuvers, temp_maneuvers)
-        temp_maneuvers.close()
+        app = self._fixed_commercial_app('all')
         
-        temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        config_data = {
-            "maneuvers_file": temp_maneuvers.name,
-            "interval_min_sec": 5,
-            "interval_max_sec": 20
-        }
-        json.dump(config_data, temp_config)
-        temp_config.close()
+        # Mark one non-emergency maneuver as completed
+        app.completed_maneuvers.append(app.maneuvers[0])  # Chandelles
         
-        try:
-            app = ChairFlying(temp_config.name)
-            app.session_mode = 'fixed'
-            app.maneuver_kind = 'commercial'
-            app.include_emergencies = True
-            app.emergency_mode = 'all'
-            app.filter_maneuvers()
-            
-            # Mark one non-emergency maneuver as completed
-            app.completed_maneuvers.append(app.maneuvers[0])  # Chandelles
-            
-            # Capture the output
-            captured_output = io.StringIO()
-            sys.stdout = captured_output
-            
+        # Capture the output
+        captured_output = io.StringIO()
+        with mock.patch("sys.stdout", captured_output):
             app.show_remaining_count()
-            
-            sys.stdout = sys.__stdout__
-            output = captured_output.getvalue()
-            
-            # Should show 4 remaining (5 total - 1 completed) when all emergencies mode
-            self.assertIn("4 maneuver(s) remaining", output)
-        finally:
-            os.unlink(temp_maneuvers.name)
-            os.unlink(temp_config.name)
+        output = captured_output.getvalue()
+        
+        # Should show 4 remaining (5 total - 1 completed) when all emergencies mode
+        self.assertIn("4 maneuver(s) remaining", output)
     
     def test_select_maneuver_fixed_random_emergencies_completion(self):
         """Test that session ends when all non-emergency maneuvers are completed in random mode."""
-        # Create a setup with multiple commercial and emergency maneuvers
-        temp_maneuvers = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        maneuvers = [
-            {"name": "Chandelles", "type": "maneuver", "kind": "commercial"},
-            {"name": "Lazy Eights", "type": "maneuver", "kind": "commercial"},
-            {"name": "Steep Turns", "type": "maneuver", "kind": "commercial"},
-            {"name": "Engine Failure", "type": "emergency"},
-            {"name": "Electrical Fire", "type": "emergency"},
-        ]
-        json.dump(maneuvers, temp_maneuvers)
-        temp_maneuvers.close()
+        app = self._fixed_commercial_app('random')
         
-        temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        config_data = {
-            "maneuvers_file": temp_maneuvers.name,
-            "interval_min_sec": 5,
-            "interval_max_sec": 20
-        }
-        json.dump(config_data, temp_config)
-        temp_config.close()
+        # Mark all non-emergency maneuvers as completed
+        for m in app.maneuvers:
+            if m.get("type", "").lower() != "emergency":
+                app.completed_maneuvers.append(m)
         
-        try:
-            app = ChairFlying(temp_config.name)
-            app.session_mode = 'fixed'
-            app.maneuver_kind = 'commercial'
-            app.include_emergencies = True
-            app.emergency_mode = 'random'
-            app.filter_maneuvers()
-            
-            # Mark all non-emergency maneuvers as completed
-            for m in app.maneuvers:
-                if m.get("type", "").lower() != "emergency":
-                    app.completed_maneuvers.append(m)
-            
-            # Session should be complete (return None) even though emergencies are not completed
-            result = app.select_maneuver()
-            self.assertIsNone(result, "Session should be complete when all non-emergency maneuvers are done in random mode")
-        finally:
-            os.unlink(temp_maneuvers.name)
-            os.unlink(temp_config.name)
+        # Session should be complete (return None) even though emergencies are not completed
+        result = app.select_maneuver()
+        self.assertIsNone(result, "Session should be complete when all non-emergency maneuvers are done in random mode")
     
     def test_select_maneuver_fixed_all_emergencies_completion(self):
         """Test that session ends only when ALL maneuvers including emergencies are completed in all mode."""
         # Create a setup with multiple commercial and emergency maneuvers
-        temp_maneuvers = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
         maneuvers = [
             {"name": "Chandelles", "type": "maneuver", "kind": "commercial"},
             {"name": "Lazy Eights", "type": "maneuver", "kind": "commercial"},
             {"name": "Engine Failure", "type": "emergency"},
         ]
-        json.dump(maneuvers, temp_maneuvers)
-        temp_maneuvers.close()
-        
-        temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
         config_data = {
-            "maneuvers_file": temp_maneuvers.name,
             "interval_min_sec": 5,
             "interval_max_sec": 20
         }
-        json.dump(config_data, temp_config)
-        temp_config.close()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            app = ChairFlying(self._write_files(tmp_dir, config_data, maneuvers))
+        app.session_mode = 'fixed'
+        app.maneuver_kind = 'commercial'
+        app.include_emergencies = True
+        app.emergency_mode = 'all'
+        app.filter_maneuvers()
         
-        try:
-            app = ChairFlying(temp_config.name)
-            app.session_mode = 'fixed'
-            app.maneuver_kind = 'commercial'
-            app.include_emergencies = True
-            app.emergency_mode = 'all'
-            app.filter_maneuvers()
-            
-            # Mark all non-emergency maneuvers as completed
-            for m in app.maneuvers:
-                if m.get("type", "").lower() != "emergency":
-                    app.completed_maneuvers.append(m)
-            
-            # Session should NOT be complete - should return an emergency maneuver
-            result = app.select_maneuver()
-            self.assertIsNotNone(result, "Session should NOT be complete when emergencies remain in all mode")
-            self.assertEqual(result.get("type", "").lower(), "emergency")
-        finally:
-            os.unlink(temp_maneuvers.name)
-            os.unlink(temp_config.name)
+        # Mark all non-emergency maneuvers as completed
+        for m in app.maneuvers:
+            if m.get("type", "").lower() != "emergency":
+                app.completed_maneuvers.append(m)
+        
+        # Session should NOT be complete - should return an emergency maneuver
+        result = app.select_maneuver()
+        self.assertIsNotNone(result, "Session should NOT be complete when emergencies remain in all mode")
+        self.assertEqual(result.get("type", "").lower(), "emergency")
     
-    def test_select_maneuver_fixed_random_no_repeats(self):
-        """Test that maneuvers don't repeat in fixed-length session with random emergencies."""
-        # Create a setup with multiple commercial and emergency maneuvers
-        temp_maneuvers = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+    def test_select_maneuver_fixed_all_visits_each_once(self):
+        """Test that a fixed-length session with all emergencies visits every maneuver once."""
+        app = ChairFlying(self.config_path)
+        app.session_mode = 'fixed'
+        app.maneuver_kind = 'all'
+        app.include_emergencies = True
+        app.emergency_mode = 'all'
+        app.filter_maneuvers()
+        
+        selected = []
+        while True:
+            maneuver = app.select_maneuver()
+            if maneuver is None:
+                break
+            self.assertLessEqual(len(selected), len(app.maneuvers), "Session did not end")
+            selected.append(maneuver["name"])
+            app.mark_maneuver_completed(maneuver)
+        
+        self.assertEqual(sorted(selected), sorted(m["name"] for m in self.test_maneuvers))
+    
+    def test_mark_maneuver_completed_duplicate_entries(self):
+        """Test that identical maneuver entries are each marked completed."""
         maneuvers = [
-            {"name": "Chandelles", "type": "maneuver", "kind": "commercial"},
-            {"name": "Lazy Eights", "type": "maneuver", "kind": "commercial"},
-            {"name": "Steep Turns", "type": "maneuver", "kind": "commercial"},
+            {"name": "Steep Turns", "type": "maneuver", "kind": "private"},
+            {"name": "Steep Turns", "type": "maneuver", "kind": "private"},
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            app = ChairFlying(self._write_files(tmp_dir, {}, maneuvers))
+        app.session_mode = 'fixed'
+        app.maneuver_kind = 'all'
+        app.include_emergencies = False
+        app.filter_maneuvers()
+        
+        for maneuver in app.maneuvers:
+            app.mark_maneuver_completed(maneuver)
+        app.mark_maneuver_completed(app.maneuvers[0])  # Marking again is a no-op
+        
+        self.assertEqual(len(app.completed_maneuvers), 2)
+        self.assertIs(app.completed_maneuvers[0], app.maneuvers[0])
+        self.assertIs(app.completed_maneuvers[1], app.maneuvers[1])
+    
+    def test_select_maneuver_fixed_all_duplicate_entries_end_session(self):
+        """Test that a fixed-length session with duplicate entries still ends."""
+        maneuvers = [
+            {"name": "Steep Turns", "type": "maneuver", "kind": "private"},
+            {"name": "Steep Turns", "type": "maneuver", "kind": "private"},
             {"name": "Engine Failure", "type": "emergency"},
-            {"name": "Electrical Fire", "type": "emergency"},
         ]
-        json.dump(maneuvers, temp_maneuvers)
-        temp_maneuvers.close()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            app = ChairFlying(self._write_files(tmp_dir, {}, maneuvers))
+        app.session_mode = 'fixed'
+        app.maneuver_kind = 'all'
+        app.include_emergencies = True
+        app.emergency_mode = 'all'
+        app.filter_maneuvers()
         
-        temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        config_data = {
-            "maneuvers_file": temp_maneuvers.name,
-            "interval_min_sec": 5,
-            "interval_max_sec": 20
-        }
-        json.dump(config_data, temp_config)
-        temp_config.close()
+        selected = []
+        while True:
+            maneuver = app.select_maneuver()
+            if maneuver is None:
+                break
+            self.assertLess(len(selected), len(maneuvers), "Session did not end")
+            selected.append(maneuver["name"])
+            app.mark_maneuver_completed(maneuver)
         
-        try:
-            app = ChairFlying(temp_config.name)
-            app.session_mode = 'fixed'
-            app.maneuver_kind = 'commercial'
-            app.include_emergencies = True
-            app.emergency_mode = 'random'
-            app.filter_maneuvers()
-            
-            # Calculate expected number of non-emergency maneuvers
-            expected_non_emergency_count = len([m for m in maneuvers if m.get('type', '').lower() != 'emergency'])
-            
-            # Select maneuvers one by one and verify no repeats
-            selected_non_emergency = []
-            attempts = 0
-            # Max attempts = expected count * 10 to allow for random emergencies while detecting bugs
-            max_attempts = expected_non_emergency_count * 10
-            
-            while len(selected_non_emergency) < expected_non_emergency_count and attempts < max_attempts:
-                attempts += 1
-                maneuver = app.select_maneuver()
-                self.assertIsNotNone(maneuver, f"Should have a maneuver at attempt {attempts}")
-                
-                if maneuver.get("type", "").lower() != "emergency":
-                    # Verify this non-emergency maneuver hasn't been selected before
-                    self.assertNotIn(maneuver, selected_non_emergency, 
-                                   f"Maneuver {maneuver['name']} was selected twice!")
-                    selected_non_emergency.append(maneuver)
-                    app.completed_maneuvers.append(maneuver)
-                # If we got an emergency, continue to next iteration without marking as completed
-            
-            # Verify we successfully selected all unique non-emergency maneuvers
-            self.assertEqual(len(selected_non_emergency), expected_non_emergency_count, 
-                           f"Should have selected {expected_non_emergency_count} unique non-emergency maneuvers")
-            
-            # After all non-emergency maneuvers are completed, session should end
-            # even if we keep getting emergencies
-            for m in app.maneuvers:
-                if m.get("type", "").lower() != "emergency" and m not in app.completed_maneuvers:
-                    app.completed_maneuvers.append(m)
+        self.assertEqual(sorted(selected), ["Engine Failure", "Steep Turns", "Steep Turns"])
+        captured_output = io.StringIO()
+        with mock.patch("sys.stdout", captured_output):
+            app.show_remaining_count()
+        self.assertNotIn("remaining", captured_output.getvalue())
+    
+    def test_select_maneuver_fixed_random_no_repeats(self):
+        """Test that maneuvers don't repeat in fixed-length session with random emergencies."""
+        app = self._fixed_commercial_app('random')
+        
+        # Calculate expected number of non-emergency maneuvers
+        expected_non_emergency_count = len([m for m in COMMERCIAL_AND_EMERGENCY_MANEUVERS if m.get('type', '').lower() != 'emergency'])
+        
+        # Select maneuvers one by one and verify no repeats
+        selected_non_emergency = []
+        attempts = 0
+        # Max attempts = expected count * 10 to allow for random emergencies while detecting bugs
+        max_attempts = expected_non_emergency_count * 10
+        
+        while len(selected_non_emergency) < expected_non_emergency_count and attempts < max_attempts:
+            attempts += 1
+            maneuver = app.select_maneuver()
+            self.assertIsNotNone(maneuver, f"Should have a maneuver at attempt {attempts}")
             
-            result = app.select_maneuver()
-            self.assertIsNone(result, "Session should be complete when all non-emergency maneuvers are done")
-        finally:
-            os.unlink(temp_maneuvers.name)
-            os.unlink(temp_config.name)
+            if maneuver.get("type", "").lower() != "emergency":
+                # Verify this non-emergency maneuver hasn't been selected before
+                self.assertNotIn(maneuver, selected_non_emergency, 
+                               f"Maneuver {maneuver['name']} was selected twice!")
+                selected_non_emergency.append(maneuver)
+                app.completed_maneuvers.append(maneuver)
+            # If we got an emergency, continue to next iteration without marking as completed
+        
+        # Verify we successfully selected all unique non-emergency maneuvers
+        self.assertEqual(len(selected_non_emergency), expected_non_emergency_count, 
+                       f"Should have selected {expected_non_emergency_count} unique non-emergency maneuvers")
+        
+        # After all non-emergency maneuvers are completed, session should end
+        # even if we keep getting emergencies
+        for m in app.maneuvers:
+            if m.get("type", "").lower() != "emergency" and m not in app.completed_maneuvers:
+                app.completed_maneuvers.append(m)
+        
+        result = app.select_maneuver()
+        self.assertIsNone(result, "Session should be complete when all non-emergency maneuvers are done")
 
 
 if __name__ == "__main__":
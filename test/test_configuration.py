@@ -4,7 +4,6 @@ Tests for Configuration class
 """
 
 import unittest
-import sys
 from chair_flying import Configuration
 
 
@@ -80,62 +79,38 @@ class TestConfiguration(unittest.TestCase):
         
         self.assertIn("maneuvers_file", str(context.exception))
     
-    def test_invalid_interval_configuration(self):
-        """Test that providing only one interval parameter raises ValueError."""
-        config_dict = {
+    def test_whole_float_intervals(self):
+        """Test that whole-number float intervals are stored as ints."""
+        config = Configuration({
             "maneuvers_file": "maneuvers.json",
-            "interval_min_sec": 30
-            # Missing interval_max_sec
-        }
-        
-        with self.assertRaises(ValueError) as context:
-            Configuration(config_dict)
+            "interval_min_sec": 5.0,
+            "interval_max_sec": 20.0
+        })
         
-        self.assertIn("together", str(context.exception))
+        self.assertEqual(config.interval_min_sec, 5)
+        self.assertIsInstance(config.interval_min_sec, int)
+        self.assertIsInstance(config.interval_max_sec, int)
     
-    def test_invalid_interval_range(self):
-        """Test that min > max raises ValueError."""
-        config_dict = {
-            "maneuvers_file": "maneuvers.json",
-            "interval_min_sec": 120,
-            "interval_max_sec": 30
-        }
-        
-        with self.assertRaises(ValueError) as context:
-            Configuration(config_dict)
-        
-        self.assertIn("less than or equal to", str(context.exception))
-    
-    def test_invalid_emergency_probability_type(self):
-        """Test that non-numeric emergency_probability raises ValueError."""
-        config_dict = {
-            "maneuvers_file": "maneuvers.json",
-            "emergency_probability": "invalid"
-        }
-        
-        with self.assertRaises(ValueError) as context:
-            Configuration(config_dict)
-        
-        self.assertIn("must be a number", str(context.exception))
-    
-    def test_invalid_emergency_probability_range(self):
-        """Test that out-of-range emergency_probability raises ValueError."""
-        config_dict = {
-            "maneuvers_file": "maneuvers.json",
-            "emergency_probability": 1.5
-        }
-        
-        with self.assertRaises(ValueError) as context:
-            Configuration(config_dict)
-        
-        self.assertIn("between 0 and 1", str(context.exception))
-        
-        config_dict["emergency_probability"] = -0.1
-        
-        with self.assertRaises(ValueError) as context:
-            Configuration(config_dict)
-        
-        self.assertIn("between 0 and 1", str(context.exception))
+    def test_invalid_values(self):
+        """Test that invalid interval and probability settings raise ValueError."""
+        base = {"maneuvers_file": "maneuvers.json"}
+        cases = [
+            # Only one interval parameter given
+            ({"interval_min_sec": 30}, "together"),
+            # min > max
+            ({"interval_min_sec": 120, "interval_max_sec": 30}, "less than or equal to"),
+            ({"interval_min_sec": 5.5, "interval_max_sec": 30}, "whole number"),
+            ({"interval_min_sec": 5, "interval_max_sec": "30"}, "whole number"),
+            ({"emergency_probability": "invalid"}, "must be a number"),
+            ({"emergency_probability": 1.5}, "between 0 and 1"),
+            ({"emergency_probability": -0.1}, "between 0 and 1"),
+        ]
+        for overrides, expected_message in cases:
+            with self.subTest(**overrides):
+                with self.assertRaises(ValueError) as context:
+                    Configuration(dict(base, **overrides))
+                
+                self.assertIn(expected_message, str(context.exception))
 
 
 if __name__ == "__main__":
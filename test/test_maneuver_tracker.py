@@ -7,8 +7,22 @@ import unittest
 import json
 import tempfile
 import os
+import io
 from pathlib import Path
-from chair_flying import ManeuverTracker
+from unittest import mock
+from datetime import datetime
+import chair_flying
+from chair_flying import ManeuverTracker, _format_timestamp
+
+# Pre-existing history file contents, encoded once at import
+EXISTING_HISTORY_BYTES = json.dumps([
+    {
+        "timestamp": "2024-01-01T12:00:00",
+        "maneuver": "Test Maneuver",
+        "type": "maneuver",
+        "status": "completed"
+    }
+]).encode()
 
 
 class TestManeuverTracker(unittest.TestCase):
@@ -16,10 +30,10 @@ class TestManeuverTracker(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        # Create a temporary file for each test
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
-        self.temp_filename = self.temp_file.name
+        # Create a temporary file for each test; mkstemp returns the descriptor
+        # directly, without a file object wrapped around it
+        fd, self.temp_filename = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
         
     def tearDown(self):
         """Clean up test fixtures."""
@@ -35,17 +49,7 @@ class TestManeuverTracker(unittest.TestCase):
     
     def test_initialization_with_existing_file(self):
         """Test tracker initialization with existing history file."""
-        # Create a history file with some data
-        history_data = [
-            {
-                "timestamp": "2024-01-01T12:00:00",
-                "maneuver": "Test Maneuver",
-                "type": "maneuver",
-                "status": "completed"
-            }
-        ]
-        with open(self.temp_filename, 'w') as f:
-            json.dump(history_data, f)
+        Path(self.temp_filename).write_bytes(EXISTING_HISTORY_BYTES)
         
         tracker = ManeuverTracker(self.temp_filename)
         self.assertEqual(len(tracker.history), 1)
@@ -54,6 +58,7 @@ class TestManeuverTracker(unittest.TestCase):
     def test_record_maneuver_completed(self):
         """Test recording a completed maneuver."""
         tracker = ManeuverTracker(self.temp_filename)
+        self.addCleanup(tracker.close)
         
         maneuver = {
             "name": "Power-Off Stall",
@@ -68,9 +73,17 @@ class TestManeuverTracker(unittest.TestCase):
         self.assertEqual(tracker.history[0]["status"], "completed")
         self.assertIn("timestamp", tracker.history[0])
     
+    def test_format_timestamp_matches_isoformat(self):
+        """Test that timestamps match datetime's local ISO format."""
+        for ns in (1_700_000_000_123_456_789, 1_700_000_000_000_000_000):
+            expected = datetime.fromtimestamp(ns // 1_000_000_000).replace(
+                microsecond=ns % 1_000_000_000 // 1000).isoformat()
+            self.assertEqual(_format_timestamp(ns), expected)
+    
     def test_record_maneuver_review(self):
         """Test recording a maneuver marked for review."""
         tracker = ManeuverTracker(self.temp_filename)
+        self.addCleanup(tracker.close)
         
         maneuver = {
             "name": "Engine Failure",
@@ -85,6 +98,7 @@ class TestManeuverTracker(unittest.TestCase):
     def test_record_maneuver_with_phase(self):
         """Test recording a maneuver with a phase."""
         tracker = ManeuverTracker(self.temp_filename)
+        self.addCleanup(tracker.close)
         
         maneuver = {
             "name": "Engine Fire During Startup",
@@ -110,6 +124,7 @@ class TestManeuverTracker(unittest.TestCase):
     def test_get_follow_ups_with_reviews(self):
         """Test getting follow-ups with review items."""
         tracker = ManeuverTracker(self.temp_filename)
+        self.addCleanup(tracker.close)
         
         maneuver1 = {"name": "Stall", "type": "maneuver"}
         maneuver2 = {"name": "Engine Failure", "type": "emergency"}
@@ -124,12 +139,26 @@ class TestManeuverTracker(unittest.TestCase):
         self.assertEqual(follow_ups[0]["maneuver"], "Engine Failure")
         self.assertEqual(follow_ups[1]["maneuver"], "Chandelles")
     
+    def test_get_follow_ups_includes_later_reviews(self):
+        """Test that reviews recorded after the first lookup are included."""
+        tracker = ManeuverTracker(self.temp_filename)
+        maneuver = {"name": "Steep Turns", "type": "maneuver"}
+        
+        tracker.record_maneuver(maneuver, "review")
+        self.assertEqual(len(tracker.get_follow_ups()), 1)
+        
+        tracker.record_maneuver(maneuver, "completed")
+        tracker.record_maneuver(maneuver, "review")
+        self.assertEqual(len(tracker.get_follow_ups()), 2)
+        tracker.close()
+    
     def test_save_and_load_history(self):
         """Test that history persists across instances."""
         # Create first tracker and add data
         tracker1 = ManeuverTracker(self.temp_filename)
         maneuver = {"name": "Test Maneuver", "type": "maneuver"}
         tracker1.record_maneuver(maneuver, "completed")
+        tracker1.close()
         
         # Create second tracker with same file
         tracker2 = ManeuverTracker(self.temp_filename)
@@ -138,11 +167,176 @@ class TestManeuverTracker(unittest.TestCase):
         self.assertEqual(len(tracker2.history), 1)
         self.assertEqual(tracker2.history[0]["maneuver"], "Test Maneuver")
     
+    def test_initialization_converts_legacy_array(self):
+        """Test that a legacy JSON array history is rewritten as JSON Lines."""
+        history_data = [
+            {"timestamp": "2024-01-01T12:00:00", "maneuver": "First", "type": "maneuver", "status": "completed"},
+            {"timestamp": "2024-01-01T12:05:00", "maneuver": "Second", "type": "emergency", "status": "review"}
+        ]
+        Path(self.temp_filename).write_text(json.dumps(history_data))
+        
+        tracker = ManeuverTracker(self.temp_filename)
+        tracker.record_maneuver({"name": "Third", "type": "maneuver"}, "completed")
+        tracker.close()
+        
+        lines = Path(self.temp_filename).read_text().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual([json.loads(line)["maneuver"] for line in lines], ["First", "Second", "Third"])
+    
+    def test_initialization_converts_legacy_json_file(self):
+        """Test that history from an older version's .json file is carried over."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            history_file = Path(tmp_dir, "maneuver_history.jsonl")
+            legacy_file = Path(tmp_dir, "maneuver_history.json")
+            legacy_file.write_bytes(EXISTING_HISTORY_BYTES)
+            
+            tracker = ManeuverTracker(history_file)
+            self.assertEqual([entry["maneuver"] for entry in tracker.history], ["Test Maneuver"])
+            self.assertFalse(legacy_file.exists())
+            self.assertTrue(Path(tmp_dir, "maneuver_history.json.bak").exists())
+            
+            # The converted file is picked up directly from now on
+            tracker = ManeuverTracker(history_file)
+            self.assertEqual([entry["maneuver"] for entry in tracker.history], ["Test Maneuver"])
+    
+    def test_record_maneuver_after_unterminated_line(self):
+        """Test that a new entry isn't joined to a last line missing its newline."""
+        Path(self.temp_filename).write_text(
+            json.dumps({"timestamp": "2024-01-01T12:00:00", "maneuver": "Existing",
+                        "type": "maneuver", "status": "completed"}))
+        
+        tracker = ManeuverTracker(self.temp_filename)
+        tracker.record_maneuver({"name": "New", "type": "maneuver"}, "completed")
+        tracker.close()
+        
+        tracker = ManeuverTracker(self.temp_filename)
+        self.assertEqual([entry["maneuver"] for entry in tracker.history], ["Existing", "New"])
+    
+    def test_initialization_moves_unreadable_legacy_array_aside(self):
+        """Test that a truncated legacy array doesn't swallow new history."""
+        Path(self.temp_filename).write_bytes(EXISTING_HISTORY_BYTES[:-10])
+        
+        with mock.patch("sys.stdout", io.StringIO()):
+            tracker = ManeuverTracker(self.temp_filename)
+        self.addCleanup(os.unlink, self.temp_filename + ".bak")
+        self.assertEqual(tracker.history, [])
+        self.assertEqual(Path(self.temp_filename + ".bak").read_bytes(), EXISTING_HISTORY_BYTES[:-10])
+        
+        tracker.record_maneuver({"name": "New", "type": "maneuver"}, "completed")
+        tracker.close()
+        
+        tracker = ManeuverTracker(self.temp_filename)
+        self.assertEqual([entry["maneuver"] for entry in tracker.history], ["New"])
+    
+    def test_record_maneuver_batches_flushes(self):
+        """Test that buffered entries are flushed once the batch size is reached."""
+        tracker = ManeuverTracker(self.temp_filename)
+        maneuver = {"name": "Steep Turns", "type": "maneuver"}
+        
+        for _ in range(ManeuverTracker.FLUSH_MAX_ENTRIES):
+            tracker.record_maneuver(maneuver, "completed")
+        
+        # Batch size reached, so entries are visible without closing the tracker
+        self.assertEqual(len(ManeuverTracker(self.temp_filename).history), ManeuverTracker.FLUSH_MAX_ENTRIES)
+        tracker.close()
+    
+    def test_flush_without_new_entries_skips_fsync(self):
+        """Test that flushing with nothing pending doesn't sync the file again."""
+        tracker = ManeuverTracker(self.temp_filename)
+        tracker.record_maneuver({"name": "Steep Turns", "type": "maneuver"}, "completed")
+        
+        with mock.patch("chair_flying.os.fsync") as fsync_mock:
+            tracker.flush()
+            tracker.flush()
+            tracker.close()
+        self.assertEqual(fsync_mock.call_count, 1)
+    
+    def test_history_includes_existing_and_new_entries_once(self):
+        """Test that lazily parsed history doesn't duplicate entries recorded this session."""
+        Path(self.temp_filename).write_text(
+            json.dumps({"timestamp": "2024-01-01T12:00:00", "maneuver": "Existing",
+                        "type": "maneuver", "status": "review"}) + "\n")
+        
+        tracker = ManeuverTracker(self.temp_filename)
+        tracker.record_maneuver({"name": "New", "type": "maneuver"}, "review")
+        tracker.close()
+        
+        self.assertEqual([entry["maneuver"] for entry in tracker.history], ["Existing", "New"])
+        self.assertEqual(len(tracker.get_follow_ups()), 2)
+    
+    def test_get_follow_ups_streams_without_parsing_history(self):
+        """Test that follow-ups are read from the file without loading full history."""
+        Path(self.temp_filename).write_text("".join(
+            json.dumps({"timestamp": "2024-01-01T12:00:00", "maneuver": name,
+                        "type": "maneuver", "status": status}) + "\n"
+            for name, status in (("Existing", "review"), ("Done", "completed"))))
+        
+        tracker = ManeuverTracker(self.temp_filename)
+        tracker.record_maneuver({"name": "New", "type": "maneuver"}, "review")
+        
+        self.assertEqual([entry["maneuver"] for entry in tracker.get_follow_ups()], ["Existing", "New"])
+        self.assertIsNone(tracker._history)
+        tracker.close()
+    
+    def test_get_follow_ups_ignores_review_in_other_fields(self):
+        """Test that only entries with review status are returned from the file."""
+        Path(self.temp_filename).write_text(
+            json.dumps({"timestamp": "2024-01-01T12:00:00", "maneuver": "review",
+                        "type": "maneuver", "status": "completed"}) + "\n"
+            + json.dumps({"timestamp": "2024-01-01T12:05:00", "maneuver": "Steep Turns",
+                          "type": "maneuver", "status": "review"}))
+        
+        tracker = ManeuverTracker(self.temp_filename)
+        self.assertEqual([entry["maneuver"] for entry in tracker.get_follow_ups()], ["Steep Turns"])
+    
+    def test_count_entries_without_parsing_history(self):
+        """Test that entries are counted without loading the full history."""
+        Path(self.temp_filename).write_text("".join(
+            json.dumps({"timestamp": "2024-01-01T12:00:00", "maneuver": name,
+                        "type": "maneuver", "status": "completed"}) + "\n"
+            for name in ("First", "Second")))
+        
+        tracker = ManeuverTracker(self.temp_filename)
+        tracker.record_maneuver({"name": "Third", "type": "maneuver"}, "completed")
+        
+        self.assertEqual(tracker.count_entries(), 3)
+        self.assertIsNone(tracker._history)
+        self.assertEqual(len(tracker.history), 3)
+        tracker.close()
+    
+    def test_count_entries_skips_unreadable_lines(self):
+        """Test that the entry count matches the parsed history when a line is damaged."""
+        Path(self.temp_filename).write_text(
+            json.dumps({"timestamp": "2024-01-01T12:00:00", "maneuver": "First",
+                        "type": "maneuver", "status": "completed"}) + "\n{ partial\n")
+        
+        with mock.patch("sys.stdout", io.StringIO()):
+            tracker = ManeuverTracker(self.temp_filename)
+            self.assertEqual(tracker.count_entries(), 1)
+            self.assertEqual(len(tracker.history), 1)
+    
+    def test_follow_ups_and_count_share_one_pass(self):
+        """Test that follow-ups and the entry count come from one pass over the file."""
+        Path(self.temp_filename).write_text("".join(
+            json.dumps({"timestamp": "2024-01-01T12:00:00", "maneuver": name,
+                        "type": "maneuver", "status": status}) + "\n"
+            for name, status in (("First", "completed"), ("Second", "review"))) + "{ partial\n")
+        
+        output = io.StringIO()
+        with mock.patch("sys.stdout", output), \
+             mock.patch("chair_flying._loads", wraps=chair_flying._loads) as loads_mock:
+            tracker = ManeuverTracker(self.temp_filename)
+            self.assertEqual([entry["maneuver"] for entry in tracker.get_follow_ups()], ["Second"])
+            self.assertEqual(tracker.count_entries(), 2)
+        
+        # Only the review line is parsed, and the damaged line is reported once
+        self.assertEqual(loads_mock.call_count, 1)
+        self.assertEqual(output.getvalue().count("Skipping unreadable line"), 1)
+    
     def test_load_history_invalid_json(self):
         """Test handling of invalid JSON in history file."""
         # Write invalid JSON to file
-        with open(self.temp_filename, 'w') as f:
-            f.write("{ invalid json }")
+        Path(self.temp_filename).write_text("{ invalid json }")
         
         # Should not raise exception, just start with empty history
         tracker = ManeuverTracker(self.temp_filename)
@@ -151,6 +345,7 @@ class TestManeuverTracker(unittest.TestCase):
     def test_record_maneuver_missing_type(self):
         """Test recording a maneuver without type field."""
         tracker = ManeuverTracker(self.temp_filename)
+        self.addCleanup(tracker.close)
         
         maneuver = {
             "name": "Basic Maneuver"
@@ -4,16 +4,50 @@ Setup Verification Script for Chair Flying
 This script helps users verify their installation is correct.
 """
 
+import os
 import sys
 import json
-from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Separator line for section headers
+_RULE = "=" * 60
+
+# Examples shown when config.json or the maneuvers file is missing
+_CONFIG_EXAMPLE = """
+{
+  "maneuvers_file": "maneuvers.json",
+  "interval_min_sec": 30,
+  "interval_max_sec": 120,
+  "show_next_maneuver_time": true,
+  "show_maneuver_type": true,
+  "show_maneuver_description": true
+}
+"""
+
+_MANEUVERS_EXAMPLE = """
+[
+  {
+    "name": "Power-Off Stall",
+    "type": "maneuver",
+    "kind": "private",
+    "description": "Demonstrate recognition and recovery from power-off stall"
+  },
+  {
+    "name": "Engine Failure on Takeoff",
+    "type": "emergency",
+    "description": "Engine fails during takeoff roll or initial climb"
+  }
+]
+"""
 
 
 def print_header(text):
     """Print a formatted header."""
-    print("\n" + "=" * 60)
-    print(text)
-    print("=" * 60)
+    print(f"\n{_RULE}\n{text}\n{_RULE}")
 
 
 def print_success(text):
@@ -31,6 +65,28 @@ def print_warning(text):
     print(f"⚠ {text}")
 
 
+def _loads(data):
+    """Parse JSON bytes with orjson if it is installed, otherwise with json."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_config():
+    """Load and parse config.json for the configuration and maneuvers checks.
+    
+    Returns:
+        Tuple of (parsed configuration, None) on success, or (None, the
+        exception raised while reading or parsing the file)
+    """
+    try:
+        with open("config.json", 'rb') as f:
+            return _loads(f.read()), None
+    except Exception as e:
+        # Reported by check_config_file
+        return None, e
+
+
 def check_python_version():
     """Check if Python version is adequate."""
     print_header("Checking Python Version")
@@ -49,8 +105,8 @@ def check_python_version():
 
 def check_file_exists(filepath, description):
     """Check if a required file exists."""
-    path = Path(filepath)
-    if path.exists():
+    # isfile() implies exists(), in a single stat
+    if os.path.isfile(filepath):
         print_success(f"{description} found: {filepath}")
         return True
     else:
@@ -58,27 +114,34 @@ def check_file_exists(filepath, description):
         return False
 
 
-def check_config_file():
-    """Check if config.json exists and is valid."""
+def check_config_file(loaded_config=None):
+    """Check if config.json exists and is valid.
+    
+    Args:
+        loaded_config: Result of _load_config(); config.json is read if not given
+    """
     print_header("Checking Configuration File")
     
-    if not check_file_exists("config.json", "Configuration file"):
+    config, error = loaded_config if loaded_config is not None else _load_config()
+    if isinstance(error, FileNotFoundError):
+        print_error("Configuration file not found: config.json")
         print("\nPlease create config.json. Example:")
-        print("""
-{
-  "maneuvers_file": "maneuvers.json",
-  "interval_min_sec": 30,
-  "interval_max_sec": 120,
-  "show_next_maneuver_time": true,
-  "show_maneuver_type": true,
-  "show_maneuver_description": true
-}
-        """)
+        print(_CONFIG_EXAMPLE)
+        return False
+    print_success("Configuration file found: config.json")
+    
+    if isinstance(error, json.JSONDecodeError):
+        print_error(f"Configuration file has invalid JSON: {error}")
+        print("\nPlease check your config.json for syntax errors:")
+        print("  - Missing or extra commas")
+        print("  - Missing quotes around strings")
+        print("  - Missing closing brackets or braces")
+        return False
+    if error is not None:
+        print_error(f"Error reading configuration: {error}")
         return False
     
     try:
-        with open("config.json", 'r') as f:
-            config = json.load(f)
         print_success("Configuration file is valid JSON")
         
         # Check required fields
@@ -107,52 +170,30 @@ def check_config_file():
         
         return True
         
-    except json.JSONDecodeError as e:
-        print_error(f"Configuration file has invalid JSON: {e}")
-        print("\nPlease check your config.json for syntax errors:")
-        print("  - Missing or extra commas")
-        print("  - Missing quotes around strings")
-        print("  - Missing closing brackets or braces")
-        return False
     except Exception as e:
         print_error(f"Error reading configuration: {e}")
         return False
 
 
-def check_maneuvers_file():
-    """Check if maneuvers file exists and is valid."""
+def check_maneuvers_file(loaded_config=None):
+    """Check if maneuvers file exists and is valid.
+    
+    Args:
+        loaded_config: Result of _load_config(); config.json is read if not given
+    """
     print_header("Checking Maneuvers File")
     
     # First, get the maneuvers file path from config
+    config, _ = loaded_config if loaded_config is not None else _load_config()
     try:
-        with open("config.json", 'r') as f:
-            config = json.load(f)
         maneuvers_file = config.get("maneuvers_file", "maneuvers.json")
     except:
         maneuvers_file = "maneuvers.json"
     
-    if not check_file_exists(maneuvers_file, "Maneuvers file"):
-        print("\nPlease create a maneuvers file. Example:")
-        print("""
-[
-  {
-    "name": "Power-Off Stall",
-    "type": "maneuver",
-    "kind": "private",
-    "description": "Demonstrate recognition and recovery from power-off stall"
-  },
-  {
-    "name": "Engine Failure on Takeoff",
-    "type": "emergency",
-    "description": "Engine fails during takeoff roll or initial climb"
-  }
-]
-        """)
-        return False
-    
     try:
-        with open(maneuvers_file, 'r') as f:
-            maneuvers = json.load(f)
+        with open(maneuvers_file, 'rb') as f:
+            print_success(f"Maneuvers file found: {maneuvers_file}")
+            maneuvers = _loads(f.read())
         
         print_success("Maneuvers file is valid JSON")
         
@@ -166,22 +207,37 @@ def check_maneuvers_file():
         
         print_success(f"Found {len(maneuvers)} maneuver(s)")
         
-        # Count by type
-        emergency_count = sum(1 for m in maneuvers if m.get("type", "").lower() == "emergency")
-        private_count = sum(1 for m in maneuvers if m.get("kind", "").lower() == "private")
-        commercial_count = sum(1 for m in maneuvers if m.get("kind", "").lower() == "commercial")
+        # Count by type and check for required fields in a single pass
+        emergency_count = private_count = commercial_count = 0
+        missing_names = []
+        for i, maneuver in enumerate(maneuvers, 1):
+            if not isinstance(maneuver, dict):
+                print_error(f"Maneuver #{i} must be a JSON object")
+                return False
+            if maneuver.get("type", "").lower() == "emergency":
+                emergency_count += 1
+            kind = maneuver.get("kind", "").lower()
+            if kind == "private":
+                private_count += 1
+            elif kind == "commercial":
+                commercial_count += 1
+            if "name" not in maneuver:
+                missing_names.append(i)
         
         print(f"  - Emergency maneuvers: {emergency_count}")
         print(f"  - Private pilot maneuvers: {private_count}")
         print(f"  - Commercial pilot maneuvers: {commercial_count}")
         
-        # Check for required fields in each maneuver
-        for i, maneuver in enumerate(maneuvers):
-            if "name" not in maneuver:
-                print_warning(f"Maneuver #{i+1} is missing 'name' field")
+        for i in missing_names:
+            print_warning(f"Maneuver #{i} is missing 'name' field")
         
         return True
         
+    except FileNotFoundError:
+        print_error(f"Maneuvers file not found: {maneuvers_file}")
+        print("\nPlease create a maneuvers file. Example:")
+        print(_MANEUVERS_EXAMPLE)
+        return False
     except json.JSONDecodeError as e:
         print_error(f"Maneuvers file has invalid JSON: {e}")
         return False
@@ -196,36 +252,46 @@ def check_main_script():
     return check_file_exists("chair_flying.py", "Main script")
 
 
+def _run_check(name, check_func, *args):
+    """Run a check, reporting any unexpected error as a failure."""
+    try:
+        return check_func(*args)
+    except Exception as e:
+        print_error(f"Unexpected error during {name} check: {e}")
+        return False
+
+
 def main():
     """Run all verification checks."""
     print_header("Chair Flying - Setup Verification")
     print("This script will verify your installation is set up correctly.")
     
-    checks = [
-        ("Python Version", check_python_version),
-        ("Main Script", check_main_script),
-        ("Configuration", check_config_file),
-        ("Maneuvers", check_maneuvers_file),
-    ]
-    
-    results = []
-    for name, check_func in checks:
-        try:
-            result = check_func()
-            results.append((name, result))
-        except Exception as e:
-            print_error(f"Unexpected error during {name} check: {e}")
-            results.append((name, False))
+    version_ok = _run_check("Python Version", check_python_version)
+    results = [("Python Version", version_ok)]
+    
+    if version_ok:
+        results.append(("Main Script", _run_check("Main Script", check_main_script)))
+        
+        # config.json is read once and handed to both checks that need it
+        loaded_config = _load_config()
+        results.append(("Configuration", _run_check("Configuration", check_config_file, loaded_config)))
+        results.append(("Maneuvers", _run_check("Maneuvers", check_maneuvers_file, loaded_config)))
+    else:
+        # Nothing else matters until Python is upgraded; None marks a skipped check
+        results.extend((name, None) for name in ("Main Script", "Configuration", "Maneuvers"))
     
     # Summary
     print_header("Verification Summary")
     
-    passed = sum(1 for _, result in results if result)
+    passed = 0
     total = len(results)
     
     for name, result in results:
         if result:
+            passed += 1
             print_success(f"{name}: OK")
+        elif result is None:
+            print_warning(f"{name}: SKIPPED")
         else:
             print_error(f"{name}: FAILED")
     
@@ -247,4 +313,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # The report is short and non-interactive, so let it go out in one write
+    # instead of a write per line on a terminal
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
     sys.exit(main())